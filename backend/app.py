@@ -3,27 +3,74 @@ import logging
 from collections.abc import Iterable
 from typing import Any
 
-from flask import Flask, jsonify, request
+from flask import Flask, request
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 from dotenv import load_dotenv
 
 
+_CORS_ALLOW_HEADERS = ("Content-Type", "Authorization")
+_CORS_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+_SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Cross-Origin-Opener-Policy", "same-origin"),
+    ("Cross-Origin-Resource-Policy", "same-site"),
+)
+
+
+_DEFAULT_ORIGINS = frozenset({"http://localhost:5173", "http://127.0.0.1:5173"})
+
+
 def _compute_cors_origins(app_config: dict, extra_env: str) -> list[str]:
-    default_origins = {"http://localhost:5173", "http://127.0.0.1:5173"}
-    cfg_origins = set(app_config.get("CORS_ORIGINS", [])) if isinstance(app_config.get("CORS_ORIGINS", []), Iterable) else set()
-    if extra_env:
-        cfg_origins |= {o.strip() for o in extra_env.split(",") if o.strip()}
-    combined = sorted(default_origins | cfg_origins)
-    return combined
+    cfg = app_config.get("CORS_ORIGINS", ())
+    if not isinstance(cfg, Iterable):
+        cfg = ()
+    extras = [o for o in (s.strip() for s in extra_env.split(",")) if o] if extra_env else ()
+    return sorted(_DEFAULT_ORIGINS.union(cfg, extras))
+
+
+# Load .env (if present) so MONGO_URI and others are available
+try:
+    load_dotenv()
+except Exception:
+    pass
+
+
+def _env_flag(name: str, default: str = "0", truthy: tuple[str, ...] = ("1", "true", "yes")) -> bool:
+    return os.environ.get(name, default).lower() in truthy
+
+
+# Process-level flags, parsed once (after .env) and shared by create_app / __main__
+# Default debug to off to avoid reloader double-import warnings under -m
+_DEBUG = _env_flag("FLASK_DEBUG", os.environ.get("DEBUG", "0"))
+_COOKIE_SECURE = _env_flag("SESSION_COOKIE_SECURE", truthy=("1", "true"))
+
+_SESSION_DEFAULTS = (
+    ("SESSION_COOKIE_NAME", "reviewer_session"),
+    ("SESSION_COOKIE_SAMESITE", "Lax"),
+    ("SESSION_COOKIE_SECURE", _COOKIE_SECURE),
+    ("SESSION_COOKIE_HTTPONLY", True),
+    ("JSON_AS_ASCII", False),
+    ("JSON_SORT_KEYS", False),
+)
+
+
+class _SuppressHeartbeat(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        name = record.name or ""
+        if name.startswith("pymongo.topology"):
+            msg = record.getMessage()
+            if "Server heartbeat started" in msg or "Server heartbeat succeeded" in msg:
+                return False
+        return True
+
+
+_HEARTBEAT_FILTER = _SuppressHeartbeat()
 
 
 def create_app() -> Flask:
-    # Load .env (if present) so MONGO_URI and others are available
-    try:
-        load_dotenv()
-    except Exception:
-        pass
     app = Flask(__name__)
 
     # === Config ===
@@ -34,8 +81,7 @@ def create_app() -> Flask:
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1)
 
     # === Logging ===
-    debug_flag = str(os.environ.get("FLASK_DEBUG", os.environ.get("DEBUG", "0"))).lower() in ("1", "true", "yes")
-    log_level = logging.DEBUG if debug_flag else logging.INFO
+    log_level = logging.DEBUG if _DEBUG else logging.INFO
     logging.basicConfig(
         level=log_level,
         format="[%(asctime)s] %(levelname)s %(name)s: %(message)s",
@@ -49,19 +95,12 @@ def create_app() -> Flask:
         for noisy in ("pymongo", "urllib3", "asyncio"):
             logging.getLogger(noisy).setLevel(logging.WARNING)
 
-        # Additionally filter specific heartbeat spam if any handler still captures DEBUG
-        class _SuppressHeartbeat(logging.Filter):
-            def filter(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
-                name = record.name or ""
-                if name.startswith("pymongo.topology"):
-                    msg = record.getMessage()
-                    if "Server heartbeat started" in msg or "Server heartbeat succeeded" in msg:
-                        return False
-                return True
-
-        hb_filter = _SuppressHeartbeat()
-        logging.getLogger("pymongo").addFilter(hb_filter)
-        logging.getLogger("pymongo.topology").addFilter(hb_filter)
+        # Additionally filter specific heartbeat spam if any handler still captures DEBUG.
+        # Loggers are process-global: install once, not once per create_app call
+        for name in ("pymongo", "pymongo.topology"):
+            lg = logging.getLogger(name)
+            if _HEARTBEAT_FILTER not in lg.filters:
+                lg.addFilter(_HEARTBEAT_FILTER)
     except Exception:
         pass
 
@@ -71,8 +110,8 @@ def create_app() -> Flask:
         app,
         supports_credentials=True,
         origins=origins,
-        allow_headers=["Content-Type", "Authorization"],
-        methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=_CORS_ALLOW_HEADERS,
+        methods=_CORS_METHODS,
     )
     app.logger.info("CORS origins: %s", origins)
 
@@ -105,55 +144,46 @@ def create_app() -> Flask:
     app.register_blueprint(admin_api)
 
     # === Route logging (once) ===
-    def _log_routes():
-        app.logger.info("=== Registered routes ===")
+    # url_map is complete once blueprints are registered: log at build time
+    # instead of hooking the first request.
+    if app.logger.isEnabledFor(logging.INFO):
+        lines = ["=== Registered routes ==="]
         for rule in sorted(app.url_map.iter_rules(), key=lambda r: (r.rule, r.endpoint)):
             methods = ",".join(sorted(rule.methods - {"HEAD", "OPTIONS"}))
-            app.logger.info(f"{rule.endpoint:32} [{methods:15}] -> {rule.rule}")
-        app.logger.info("=========================")
-
-    if hasattr(app, "before_serving"):
-        app.before_serving(_log_routes)  # type: ignore
-    else:
-        _logged = {"done": False}
-
-        @app.before_request
-        def _maybe_log_once():
-            if not _logged["done"]:
-                _log_routes()
-                _logged["done"] = True
+            lines.append(f"{rule.endpoint:32} [{methods:15}] -> {rule.rule}")
+        lines.append("=========================")
+        app.logger.info("\n".join(lines))
 
     # === Per-request debug logging ===
-    @app.before_request
-    def _log_request():
-        if app.logger.isEnabledFor(logging.DEBUG):
+    # Level is fixed above, so only install the hook when it can actually log
+    if app.logger.isEnabledFor(logging.DEBUG):
+        @app.before_request
+        def _log_request():
             app.logger.debug("Incoming %s %s from %s", request.method, request.path, request.remote_addr)
 
     # === Security headers ===
     @app.after_request
     def _security_headers(resp):
-        headers = {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Cross-Origin-Opener-Policy": "same-origin",
-            "Cross-Origin-Resource-Policy": "same-site",
-        }
-        for k, v in headers.items():
+        for k, v in _SECURITY_HEADERS:
             resp.headers.setdefault(k, v)
         return resp
 
     # === Health fallback ===
+    from backend.routes.meta import HEALTH_BODY
+
     @app.get("/api/meta/health")
     def _health():
-        return jsonify({"success": True, "data": {"status": "ok"}}), 200
+        return app.response_class(HEALTH_BODY, mimetype="application/json"), 200
 
     # === Error handlers helpers ===
+    # Bound once: every error path formats through the app's JSON provider directly
+    _json_response = app.json.response
+
     def _error_response(message: str, status: int, path: str | None = None):
         payload: dict[str, Any] = {"success": False, "message": message}
         if path:
             payload["path"] = path
-        return jsonify(payload), status
+        return _json_response(payload), status
 
     app.register_error_handler(404, lambda e: _error_response("Not found", 404, request.path))
     app.register_error_handler(405, lambda e: _error_response("Method not allowed", 405, request.path))
@@ -169,15 +199,9 @@ def create_app() -> Flask:
         return _error_response("Server error", 500)
 
     # === Session / JSON defaults ===
-    app.config.setdefault("SESSION_COOKIE_NAME", "reviewer_session")
-    app.config.setdefault("SESSION_COOKIE_SAMESITE", "Lax")
-    app.config.setdefault(
-        "SESSION_COOKIE_SECURE",
-        str(os.environ.get("SESSION_COOKIE_SECURE", "0")).lower() in ("1", "true"),
-    )
-    app.config.setdefault("SESSION_COOKIE_HTTPONLY", True)
-    app.config.setdefault("JSON_AS_ASCII", False)
-    app.config.setdefault("JSON_SORT_KEYS", False)
+    cfg = app.config
+    for k, v in _SESSION_DEFAULTS:
+        cfg.setdefault(k, v)
 
     return app
 
@@ -188,8 +212,6 @@ app = create_app()
 if __name__ == "__main__":
     host = os.environ.get("FLASK_HOST", "0.0.0.0")
     port = int(os.environ.get("FLASK_PORT", "5050"))
-    # Default debug to off to avoid reloader double-import warnings under -m
-    debug_flag = str(os.environ.get("FLASK_DEBUG", os.environ.get("DEBUG", "0"))).lower() in ("1", "true", "yes")
     # When running as a module (python -m backend.app), disable the reloader to prevent duplicate import/execution
     use_reloader = False
-    app.run(debug=debug_flag, host=host, port=port, use_reloader=use_reloader)
\ No newline at end of file
+    app.run(debug=_DEBUG, host=host, port=port, use_reloader=use_reloader)
\ No newline at end of file
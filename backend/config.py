@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import os
+import time
 import logging
 from pathlib import Path
 from functools import lru_cache
-from typing import Any, Optional, List, Sequence, Union, Iterable
+from typing import Any, Optional, List, Sequence, Tuple, Union, Iterable
 
 # ---- env helpers -----------------------------------------------------------
 
@@ -84,34 +85,30 @@ REWARD_PER_ASSERTION_ADD: float = _env_float("REWARD_PER_ASSERTION_ADD", 0.0)
 
 # ---- vocab ---------------------------------------------------------------
 
-try:
-    from backend.services.vocab import get_whitelists as _get_whitelists  # noqa
-    PREDICATE_WHITELIST, ENTITY_TYPE_WHITELIST = _get_whitelists()
-except Exception:
-    PREDICATE_WHITELIST = [
-        "PREDISPOSES","COEXISTS_WITH","TREATS","AFFECTS","ISA","PROCESS_OF","USES",
-    "ASSOCIATED_WITH","CAUSES","DIAGNOSES","MANIFESTATION_OF","LOCATION_OF","PRECEDES",
-    "PART_OF","PREVENTS","DISRUPTS","COMPLICATES","ADMINISTERED_TO","PRODUCES",
-    "INTERACTS_WITH","OCCURS_IN","COMPARED_WITH","AUGMENTS","STIMULATES","SAME_AS",
-    "METHOD_OF","MEASUREMENT_OF","INHIBITS","CONVERTS_TO",
-    ]
-    ENTITY_TYPE_WHITELIST = ["acab","anab","cgab","dsyn","emod","fndg","inpo","mobd","neop","orga","patf","phsu","sosy"]
+# 词表唯一来源是 services.vocab（纯数据模块，无外部依赖）；此处不再保留一份重复的硬编码列表
+from backend.services.vocab import get_whitelists as _get_whitelists
+PREDICATE_WHITELIST, ENTITY_TYPE_WHITELIST = _get_whitelists()
+
+# O(1) 成员判断；vocab 默认给小写谓词而 UI 用大写 id，这里大小写两种都收录
+_PREDICATE_SET = frozenset(v for p in PREDICATE_WHITELIST for v in (p, p.upper(), p.lower()))
+_ENTITY_TYPE_SET = frozenset(v for t in ENTITY_TYPE_WHITELIST for v in (t, t.upper(), t.lower()))
 
 def validate_predicate(predicate: str) -> bool:
-    return predicate in PREDICATE_WHITELIST
+    return isinstance(predicate, str) and predicate in _PREDICATE_SET
 
 def validate_entity_type(et: str) -> bool:
-    return et in ENTITY_TYPE_WHITELIST
+    return isinstance(et, str) and et in _ENTITY_TYPE_SET
 
 # ---- UI / site -------------------------------------------------------------
 
 SITE_TITLE: str = _env("MANUAL_REVIEW_SITE_TITLE", "Manual Assertion Review Platform")
 
-CORS_ORIGINS: List[str] = list({
+# 按插入顺序去重（set 的迭代顺序不稳定），构建一次并以不可变 tuple 暴露
+CORS_ORIGINS: Tuple[str, ...] = tuple(dict.fromkeys((
     "http://localhost:5173",
     "http://127.0.0.1:5173",
     *_env_list("ALLOWED_ORIGINS", []),
-})
+)))
 
 # ---- logging ---------------------------------------------------------------
 
@@ -127,10 +124,12 @@ def _parse_log_level(val: Union[int, str], default: int = logging.INFO) -> int:
     return getattr(logging, s.upper(), default)
 
 LOG_LEVEL: Union[int, str] = _env("MANUAL_REVIEW_LOG_LEVEL", "INFO")
+# 只解析一次；get_logger 按 name 缓存（原来 maxsize=1，不同模块交替调用会反复失效重建）
+_LOG_LEVEL_NO: int = _parse_log_level(LOG_LEVEL)
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
-    level = _parse_log_level(LOG_LEVEL)
+    level = _LOG_LEVEL_NO
     logger = logging.getLogger(name or __name__)
     if not logger.handlers:
         handler = logging.StreamHandler()
@@ -168,24 +167,59 @@ FEATURE_FLAGS = {
 
 # ---- integrity check ------------------------------------------------------
 
+# 结果按「当前生效路径」缓存：目录只需创建一次，abstracts 是否存在最多每 5s 复查一次
+# （健康检查等频繁调用不再每次 stat + 3 次 mkdir）。
+_INTEGRITY_TTL = 5.0
+_integrity_state: dict = {}
+
+_PATH_ENV_KEYS = (
+    "MANUAL_REVIEW_ABSTRACTS_PATH",
+    "MANUAL_REVIEW_REVIEW_LOGS_PATH",
+    "MANUAL_REVIEW_REVIEWERS_JSON",
+    "MANUAL_REVIEW_FINAL_EXPORT_PATH",
+)
+
+@lru_cache(maxsize=8)
+def _resolve_runtime_paths(env: Tuple[Optional[str], ...]) -> Tuple[Path, Tuple[Path, ...]]:
+    """(abstracts 文件, 需要存在的目录) —— 以环境变量原值为键，命中时不再构造 Path。"""
+    abstracts, logs, reviewers, final = env
+    return (
+        Path(abstracts) if abstracts else ABSTRACTS_PATH,
+        (
+            (Path(logs) if logs else REVIEW_LOGS_PATH).parent,
+            (Path(reviewers) if reviewers else REVIEWERS_JSON).parent,
+            (Path(final) if final else FINAL_EXPORT_PATH).parent,
+        ),
+    )
+
+def invalidate_runtime_paths() -> None:
+    """Forget resolved paths and integrity results (tests that rewrite files in place)."""
+    _resolve_runtime_paths.cache_clear()
+    _integrity_state.clear()
+
 def assert_integrity(raise_on_missing: bool = False) -> bool:
     """
     校验关键文件。abstracts 文件必须存在；其他只是确保目录结构。
+    路径按调用时的环境变量解析（未设置时回落到模块常量）。
     """
-    ok = True
-    missing = []
-
-    if not ABSTRACTS_PATH.exists():
-        missing.append(str(ABSTRACTS_PATH))
-        ok = False
-
-    # 确保其他目录存在（但不强制它们已有文件）
-    REVIEW_LOGS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    REVIEWERS_JSON.parent.mkdir(parents=True, exist_ok=True)
-    EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    key = tuple(map(os.environ.get, _PATH_ENV_KEYS))
+    abstracts, dirs = _resolve_runtime_paths(key)
+    now = time.monotonic()
+    hit = _integrity_state.get(key)
+
+    if hit is None:
+        # 确保其他目录存在（但不强制它们已有文件）
+        for d in dirs:
+            d.mkdir(parents=True, exist_ok=True)
+
+    if hit is None or now - hit[1] > _INTEGRITY_TTL:
+        ok = abstracts.exists()
+        _integrity_state[key] = (ok, now)
+        if not ok and not raise_on_missing:
+            get_logger(__name__).warning(f"Missing required path(s): {abstracts}")
+    else:
+        ok = hit[0]
 
     if not ok and raise_on_missing:
-        raise FileNotFoundError(f"Missing required path(s): {', '.join(missing)}")
-    if not ok:
-        get_logger(__name__).warning(f"Missing required path(s): {', '.join(missing)}")
-    return ok
\ No newline at end of file
+        raise FileNotFoundError(f"Missing required path(s): {abstracts}")
+    return ok
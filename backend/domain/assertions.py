@@ -1,11 +1,13 @@
 # backend/domain/assertions.py
 from __future__ import annotations
 
+import os
+import threading
 import uuid
-import copy
 import time
 from typing import Any, Dict, List
 import hashlib
+from functools import lru_cache
 
 __all__ = [
     "make_assertion_id",
@@ -22,6 +24,70 @@ __all__ = [
 def _now_ts() -> float:
     return time.time()
 
+# content_hash 算法：默认 sha1，保证已有日志里的 content_hash 不变；
+# 新部署可设 CONTENT_HASH_ALGO=blake2b（digest_size=20，同样 40 位 hex，短输入更快）。
+CONTENT_HASH_ALGO: str = (os.environ.get("CONTENT_HASH_ALGO") or "sha1").strip().lower()
+
+def _content_hasher(algo: str):
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=20)
+    return hashlib.sha1()
+
+@lru_cache(maxsize=16384)
+def _norm(s: str) -> bytes:
+    return s.strip().lower().encode("utf-8")
+
+@lru_cache(maxsize=8192)
+def _hash_norm(algo: str, parts: tuple) -> str:
+    # 逐段 update，省掉中间的 join 字符串；结果与 hash("|".join(...)) 完全一致
+    h = _content_hasher(algo)
+    h.update(parts[0])
+    for part in parts[1:]:
+        h.update(b"|")
+        h.update(part)
+    return h.hexdigest()
+
+# uuid4 随机字节按 4KiB 批量取（每线程一份池），省掉每条记录一次 urandom 系统调用。
+# 记录 pid：fork 出来的 worker 不能沿用父进程池里的字节，否则会生成重复 id。
+_UUID_POOL_SIZE = 4096
+_uuid_pool = threading.local()
+
+def _fast_uuid4_str() -> str:
+    pool = _uuid_pool
+    pid = os.getpid()
+    buf = getattr(pool, "buf", None)
+    idx = getattr(pool, "idx", _UUID_POOL_SIZE)
+    if buf is None or idx >= _UUID_POOL_SIZE or pool.pid != pid:
+        buf = pool.buf = os.urandom(_UUID_POOL_SIZE)
+        pool.pid = pid
+        idx = 0
+    pool.idx = idx + 16
+    return str(uuid.UUID(bytes=buf[idx:idx + 16], version=4))
+
+# modify/reject/uncertain 记录里的断言内容快照字段（顺序即落盘顺序）
+_SNAPSHOT_FIELDS = ("subject", "subject_type", "predicate", "object", "object_type", "negation")
+
+def _content_snapshot(src: Dict[str, Any], pmid: str | int, sentence_idx: int) -> tuple[Dict[str, Any], str]:
+    """Read the content fields once; return (snapshot dict, content_hash) for a log record."""
+    subject, subject_type, predicate, object_, object_type, negation = (src.get(f) for f in _SNAPSHOT_FIELDS)
+    snap = {
+        "subject": subject,
+        "subject_type": subject_type,
+        "predicate": predicate,
+        "object": object_,
+        "object_type": object_type,
+        "negation": bool(negation),
+    }
+    return snap, compute_content_hash(
+        pmid=pmid,
+        sentence_idx=sentence_idx,
+        subject=subject,
+        subject_type=subject_type,
+        predicate=predicate,
+        object_=object_,
+        object_type=object_type,
+    )
+
 def make_assertion_id(subject: str, subject_type: str, predicate: str, object_: str, object_type: str) -> str:
     """
     Deterministic key used for grouping the *same* logical assertion content
@@ -44,19 +110,19 @@ def compute_content_hash(
     """
     Canonical unique identifier per requirements:
     hash(lower(trim(subject)), lower(trim(subject_type)), lower(trim(predicate)), lower(trim(object)), lower(trim(object_type)), sentence_index, pmid)
-    joined in order and hashed (sha1) to a hex string.
+    joined in order and hashed (sha1 by default, see CONTENT_HASH_ALGO) to a hex string.
     """
-    parts = [
-        str(pmid).strip().lower(),
-        str(sentence_idx).strip().lower(),
-        (subject or "").strip().lower(),
-        (subject_type or "").strip().lower(),
-        (predicate or "").strip().lower(),
-        (object_ or "").strip().lower(),
-        (object_type or "").strip().lower(),
-    ]
-    joined = "|".join(parts)
-    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+    # 同一断言的 add/modify/reject/uncertain 会反复算同一组字段，归一化与哈希都走缓存
+    parts = (
+        _norm(str(pmid)),
+        _norm(str(sentence_idx)),
+        _norm(subject or ""),
+        _norm(subject_type or ""),
+        _norm(predicate or ""),
+        _norm(object_ or ""),
+        _norm(object_type or ""),
+    )
+    return _hash_norm(CONTENT_HASH_ALGO, parts)
 
 # ---------------------------------------------------------------------------
 # Constructors for atomic log records
@@ -91,7 +157,7 @@ def new_assertion(
 
     return {
         "version": 1,
-        "assertion_id": str(uuid.uuid4()),
+        "assertion_id": _fast_uuid4_str(),
         "action": "add",
         "related_to": None,
         "creator": creator,
@@ -129,11 +195,9 @@ def update_assertion(
     Create a 'modify' (or no-op 'accept') log by applying updated_fields to original.
     若没有任何字段变化，则 action=accept（为了向后兼容，但通常上层会在无变化时不落日志）。
     """
-    fields = ["subject", "subject_type", "predicate", "object", "object_type", "negation"]
-
     # 计算变更列表
     changed: List[str] = []
-    for f in fields:
+    for f in _SNAPSHOT_FIELDS:
         old_v = original.get(f)
         new_v = updated_fields.get(f, old_v)
         if f == "negation":
@@ -142,15 +206,13 @@ def update_assertion(
         if old_v != new_v:
             changed.append(f)
 
-    # 构造 updated 内容（原子快照）
-    updated = copy.deepcopy(original)
-    for k in fields:
-        if k in updated_fields:
-            updated[k] = updated_fields[k]
+    # 构造 updated 内容（原子快照）：只取这六个标量字段，无需整份 deepcopy
+    updated = {f: (updated_fields[f] if f in updated_fields else original.get(f)) for f in _SNAPSHOT_FIELDS}
+    snap, content_hash = _content_snapshot(updated, pmid, sentence_idx)
 
     return {
         "version": 1,
-        "assertion_id": str(uuid.uuid4()),
+        "assertion_id": _fast_uuid4_str(),
         "action": "modify" if changed else "accept",
         "related_to": original.get("assertion_id"),
         "creator": updater,
@@ -160,23 +222,10 @@ def update_assertion(
         "sentence_idx": sentence_idx,
         "sentence_text": sentence_text,
 
-        "subject": updated.get("subject"),
-        "subject_type": updated.get("subject_type"),
-        "predicate": updated.get("predicate"),
-        "object": updated.get("object"),
-        "object_type": updated.get("object_type"),
-        "negation": bool(updated.get("negation", False)),
+        **snap,
 
         "comment": comment,
-        "content_hash": compute_content_hash(
-            pmid=pmid,
-            sentence_idx=sentence_idx,
-            subject=updated.get("subject"),
-            subject_type=updated.get("subject_type"),
-            predicate=updated.get("predicate"),
-            object_=updated.get("object"),
-            object_type=updated.get("object_type"),
-        ),
+        "content_hash": content_hash,
         "created_at": _now_ts(),
 
         "changed_fields": changed,  # ⭐️ 便于后续仲裁/审计
@@ -194,9 +243,10 @@ def reject_assertion(
     """
     Create a 'reject' log entry against an existing assertion.
     """
+    snap, content_hash = _content_snapshot(original, pmid, sentence_idx)
     return {
         "version": 1,
-        "assertion_id": str(uuid.uuid4()),
+        "assertion_id": _fast_uuid4_str(),
         "action": "reject",
         "related_to": original.get("assertion_id"),
         "reviewer": reviewer,
@@ -207,23 +257,10 @@ def reject_assertion(
         "sentence_text": sentence_text,
 
         # 保留被拒绝的原断言内容以便独立审计（快照）
-        "subject": original.get("subject"),
-        "subject_type": original.get("subject_type"),
-        "predicate": original.get("predicate"),
-        "object": original.get("object"),
-        "object_type": original.get("object_type"),
-        "negation": bool(original.get("negation", False)),
+        **snap,
 
         "reason": reason,
-        "content_hash": compute_content_hash(
-            pmid=pmid,
-            sentence_idx=sentence_idx,
-            subject=original.get("subject"),
-            subject_type=original.get("subject_type"),
-            predicate=original.get("predicate"),
-            object_=original.get("object"),
-            object_type=original.get("object_type"),
-        ),
+        "content_hash": content_hash,
         "created_at": _now_ts(),
     }
 
@@ -239,9 +276,10 @@ def uncertain_assertion(
     """
     Create an 'uncertain' log entry with optional comment.
     """
+    snap, content_hash = _content_snapshot(original, pmid, sentence_idx)
     return {
         "version": 1,
-        "assertion_id": str(uuid.uuid4()),
+        "assertion_id": _fast_uuid4_str(),
         "action": "uncertain",
         "related_to": original.get("assertion_id"),
         "reviewer": reviewer,
@@ -252,22 +290,9 @@ def uncertain_assertion(
         "sentence_text": sentence_text,
 
         # 保留快照
-        "subject": original.get("subject"),
-        "subject_type": original.get("subject_type"),
-        "predicate": original.get("predicate"),
-        "object": original.get("object"),
-        "object_type": original.get("object_type"),
-        "negation": bool(original.get("negation", False)),
+        **snap,
 
         "comment": comment,
-        "content_hash": compute_content_hash(
-            pmid=pmid,
-            sentence_idx=sentence_idx,
-            subject=original.get("subject"),
-            subject_type=original.get("subject_type"),
-            predicate=original.get("predicate"),
-            object_=original.get("object"),
-            object_type=original.get("object_type"),
-        ),
+        "content_hash": content_hash,
         "created_at": _now_ts(),
     }
\ No newline at end of file
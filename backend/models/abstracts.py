@@ -1,8 +1,14 @@
 # backend/models/abstracts.py
 from __future__ import annotations
 
+import copy
+import sys
 import threading
-from typing import Any, Dict, List, Optional, Union
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..config import _env_float
 
 try:
     # MongoDB collection for abstracts (REQUIRED for runtime)
@@ -10,31 +16,57 @@ try:
 except Exception as e:  # pragma: no cover
     abstracts_col = None  # type: ignore
 
-_lock = threading.RLock()
+# 只保护 LRU 的复合修改（插入+淘汰、过期删除）；命中路径不持锁。
+# 缓存里的文档是写入时 deepcopy 的不可变快照，复制可以放在锁外做。
+_lock = threading.Lock()
+
+# Per-process LRU for get_abstract_by_id: pmid -> (expires_at, normalized doc).
+# TTL bounds staleness against writes made by other worker processes.
+_ABS_CACHE_MAX = 1024
+_ABS_CACHE_TTL = _env_float("ABSTRACT_CACHE_TTL", 30.0)
+_abs_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# get_all_pmids 在队列/概览/导出等每个请求里都会全表扫描一次 pmid；
+# 用很短的 TTL 去抖（默认 1s），写入后 invalidate_cache() 立即失效。
+_PMIDS_TTL = _env_float("ABSTRACT_PMIDS_TTL", 1.0)
+_pmids_cache: Optional[Tuple[float, Tuple[str, ...]]] = None
+_pmids_fill_lock = threading.Lock()
+_pmids_gen = 0  # invalidate_cache 时递增
 
 # ---------------------------------------------------------------------------
 # Normalize
 # ---------------------------------------------------------------------------
 
-def _strip_object_ids(obj: Dict[str, Any]) -> Dict[str, Any]:
+# 不取顶层 ObjectId：省掉每个文档的 BSON 解码
+_NO_OID = {"_id": 0}
+
+# 全表游标的批大小：默认首批只有 101 条、之后按 16MB 装批。
+# pmid 投影的文档极小，大批次减少 getMore 往返；完整摘要较大，限制单批内存峰值。
+_BATCH_PMIDS = 5000
+_BATCH_PROJECTED = 1000
+_BATCH_FULL = 200
+
+# pmid 唯一索引（db.ensure_indexes 创建）。空条件查询默认走 COLLSCAN；
+# hint 到该索引并投影掉 _id 后，pmid 扫描成为只读索引的覆盖查询，不解码文档正文
+_PMID_INDEX = "pmid_unique"
+
+# 取值来自很小的白名单（谓词/实体类型），intern 后缓存中的重复字符串共享同一对象
+_INTERN_KEYS = ("predicate", "subject_type", "object_type")
+
+def _strip_object_ids(obj: Dict[str, Any]) -> None:
+    """Drop top-level and nested ``_id`` keys (defensive, for legacy unprojected docs).
+
+    Imports go through the pydantic schema, which never emits nested ``_id``,
+    so this is kept off the normal read path.
+    """
     obj.pop("_id", None)
-    # Also strip possible nested _id from sentences/assertions
-    try:
-        for s in obj.get("sentences", []) or []:
+    for key in ("sentences", "sentence_results"):
+        for s in obj.get(key) or []:
             if isinstance(s, dict):
                 s.pop("_id", None)
-                for a in s.get("assertions", []) or []:
-                    if isinstance(a, dict):
-                        a.pop("_id", None)
-        for s in obj.get("sentence_results", []) or []:
-            if isinstance(s, dict):
-                s.pop("_id", None)
-                for a in s.get("assertions", []) or []:
-                    if isinstance(a, dict):
-                        a.pop("_id", None)
-    except Exception:
-        pass
-    return obj
+                for asr in s.get("assertions") or []:
+                    if isinstance(asr, dict):
+                        asr.pop("_id", None)
 
 def _normalize_abstract(a: Dict[str, Any]) -> Dict[str, Any]:
     """Ensure minimal structural integrity for an abstract object.
@@ -44,77 +76,204 @@ def _normalize_abstract(a: Dict[str, Any]) -> Dict[str, Any]:
     - MongoDB-based docs (import_service) use key: "sentences"
     We convert everything into the file-compatible shape with "sentence_results".
     """
-    # Strip internal Mongo identifiers first
-    a = _strip_object_ids(a)
+    if "_id" in a:
+        # 读路径都用 _NO_OID 投影；只有未投影的旧调用方/遗留文档才会带 _id，此时才做整棵清理
+        _strip_object_ids(a)
 
-    # DB stores `sentences`; normalize to file-compatible `sentence_results` shape used by the UI
-    if isinstance(a.get("sentences"), list):
-        sentences = a.get("sentences") or []
+    # DB stores `sentences`; normalize to file-compatible `sentence_results` shape used by the UI.
+    # 每句复制一份：调用方改 sentence_results 里的句子不会改到 sentences
+    sentences = a.get("sentences")
+    if isinstance(sentences, list):
         sentence_results: List[Dict[str, Any]] = []
         for idx, s in enumerate(sentences, 1):
-            sr = {
-                "sentence_index": s.get("sentence_index", idx),
-                "sentence": s.get("sentence", ""),
-                "assertions": s.get("assertions", []) if isinstance(s.get("assertions"), list) else [],
-            }
-            sentence_results.append({**s, **sr})
+            if not isinstance(s, dict):
+                continue
+            sr = dict(s)
+            sr.setdefault("sentence_index", idx)
+            sr.setdefault("sentence", "")
+            sentence_results.append(sr)
         a["sentence_results"] = sentence_results
-
-    if "sentence_results" not in a or not isinstance(a["sentence_results"], list):
+    elif not isinstance(a.get("sentence_results"), list):
         a["sentence_results"] = []
+
+    # 单次遍历：补齐 assertions、intern 白名单字段
     for s in a["sentence_results"]:
-        if "assertions" not in s or not isinstance(s["assertions"], list):
+        if not isinstance(s, dict):
+            continue
+        assertions = s.get("assertions")
+        if not isinstance(assertions, list):
             s["assertions"] = []
+            continue
+        for asr in assertions:
+            if isinstance(asr, dict):
+                for k in _INTERN_KEYS:
+                    v = asr.get(k)
+                    if type(v) is str:
+                        asr[k] = sys.intern(v)
 
     # Maintain sentence_count coherently
     if not isinstance(a.get("sentence_count"), int):
-        a["sentence_count"] = len(a["sentence_results"]) if isinstance(a["sentence_results"], list) else 0
-    return _strip_object_ids(a)
+        a["sentence_count"] = len(a["sentence_results"])
+    return a
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def load_abstracts(force_reload: bool = False) -> List[Dict[str, Any]]:
-    """Load abstracts strictly from MongoDB (authoritative source)."""
+def load_abstracts(force_reload: bool = False, *, fields: Optional[Tuple[str, ...]] = None) -> List[Dict[str, Any]]:
+    """Load abstracts strictly from MongoDB (authoritative source).
+
+    With ``fields`` only those keys are fetched (Mongo projection) and the docs are
+    returned un-normalized — for callers that just need e.g. the pmid list.
+    """
     if abstracts_col is None:
         raise RuntimeError("MongoDB is not configured (MONGO_URI missing).")
-    with _lock:
-        docs = list(abstracts_col.find({}))
-        out: List[Dict[str, Any]] = []
-        for d in docs:
+    if fields and tuple(fields) == ("pmid",):
+        # 只要 pmid 的调用方（分配逻辑）直接复用 pmid 快照，不再每次全表投影
+        return [{"pmid": p} for p in _pmid_snapshot()]
+    if fields:
+        projection = {f: 1 for f in fields}
+        projection["_id"] = 0
+        out = []
+        for d in abstracts_col.find({}, projection, batch_size=_BATCH_PROJECTED):
             if d.get("pmid") is not None:
-                d["pmid"] = str(d["pmid"])  # ensure string
-            out.append(_normalize_abstract(d))
+                d["pmid"] = str(d["pmid"])
+            out.append(d)
         return out
+    out: List[Dict[str, Any]] = []
+    for d in abstracts_col.find({}, _NO_OID, batch_size=_BATCH_FULL):
+        if d.get("pmid") is not None:
+            d["pmid"] = str(d["pmid"])  # ensure string
+        out.append(_normalize_abstract(d))
+    return out
+
+def iter_abstracts(batch: int = 500, *, fields: Optional[Tuple[str, ...]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream raw (un-normalized) abstract docs, one ``_id``-ordered page at a time.
+
+    Range pagination on ``_id`` keeps memory bounded by ``batch`` and, unlike one
+    long cursor, cannot hit the server's idle-cursor timeout while a slow consumer
+    (e.g. an export) works through the collection.
+    """
+    if abstracts_col is None:
+        raise RuntimeError("MongoDB is not configured (MONGO_URI missing).")
+    projection = {f: 1 for f in fields} if fields else None  # _id 默认包含，分页要用
+    last = None
+    while True:
+        q = {"_id": {"$gt": last}} if last is not None else {}
+        page = list(abstracts_col.find(q, projection).sort("_id", 1).limit(batch))
+        if not page:
+            return
+        last = page[-1]["_id"]
+        for d in page:
+            d.pop("_id", None)
+            yield d
+        if len(page) < batch:
+            return
 
 def invalidate_cache() -> None:
-    # No-op retained for compatibility; DB is the source of truth now
-    return None
+    """Drop cached abstracts (call after writing to the abstracts collection)."""
+    global _pmids_cache, _pmids_gen
+    with _lock:
+        _abs_cache.clear()
+        _pmids_cache = None
+        _pmids_gen += 1
+
+def _cache_get(target: str) -> Optional[Dict[str, Any]]:
+    hit = _abs_cache.get(target)  # 单次 dict 读取，GIL 下原子
+    if hit is None:
+        return None
+    if hit[0] < time.monotonic():
+        # 过期删除是"检查再删除"的复合操作，只有这里需要锁
+        with _lock:
+            if _abs_cache.get(target) is hit:
+                del _abs_cache[target]
+        return None
+    # 命中路径无锁：条目是不可变快照（写入时已复制），move_to_end 是单个 C 调用，GIL 下原子
+    try:
+        _abs_cache.move_to_end(target)
+    except KeyError:  # 并发下已被淘汰/清空，快照本身仍可用
+        pass
+    # 返回副本，调用方可能就地修改
+    return copy.deepcopy(hit[1])
+
+def _cache_put(target: str, doc: Dict[str, Any]) -> None:
+    if _ABS_CACHE_TTL <= 0:
+        return
+    entry = (time.monotonic() + _ABS_CACHE_TTL, copy.deepcopy(doc))
+    with _lock:
+        _abs_cache[target] = entry
+        _abs_cache.move_to_end(target)
+        while len(_abs_cache) > _ABS_CACHE_MAX:
+            _abs_cache.popitem(last=False)
 
 def get_abstract_by_id(abs_id: Union[str, int]) -> Optional[Dict[str, Any]]:
-    """Get abstract by PMID from MongoDB only."""
+    """Get abstract by PMID from MongoDB only (hits are cached per process)."""
     if abstracts_col is None:
         raise RuntimeError("MongoDB is not configured (MONGO_URI missing).")
     target = str(abs_id)
+    cached = _cache_get(target)
+    if cached is not None:
+        return cached
     try:
-        doc = abstracts_col.find_one({"pmid": target})
+        doc = abstracts_col.find_one({"pmid": target}, _NO_OID)
         if doc:
             if doc.get("pmid") is not None:
                 doc["pmid"] = str(doc["pmid"])
-            return _normalize_abstract(doc)
+            doc = _normalize_abstract(doc)
+            _cache_put(target, doc)
+            return doc
     except Exception:
         return None
     return None
 
-def get_all_pmids() -> List[str]:
-    """Return all PMIDs as strings from MongoDB."""
+def _pmid_snapshot() -> Tuple[str, ...]:
+    """PMIDs as an immutable tuple, re-scanned at most once per ``_PMIDS_TTL`` (raises on DB errors)."""
+    hit = _pmids_cache
+    if hit is not None and hit[0] >= time.monotonic():
+        return hit[1]  # 命中：无锁、无查询
+    # 过期时只让一个线程去扫表，其余线程等它发布新快照后直接复用（防止并发击穿）
+    with _pmids_fill_lock:
+        hit = _pmids_cache
+        if hit is not None and hit[0] >= time.monotonic():
+            return hit[1]
+        return _fill_pmid_snapshot()
+
+def _scan_pmids(hint: Optional[str]) -> Tuple[str, ...]:
+    kw: Dict[str, Any] = {"batch_size": _BATCH_PMIDS}
+    if hint:
+        kw["hint"] = hint
+    # 单次遍历：每个文档只取一次 pmid；已是 str（常见）时不再 str() 一遍
+    return tuple(
+        p if type(p) is str else str(p)
+        for p in (d.get("pmid") for d in abstracts_col.find({}, {"pmid": 1, "_id": 0}, **kw))
+        if p
+    )
+
+def _fill_pmid_snapshot() -> Tuple[str, ...]:
+    global _pmids_cache
+    gen = _pmids_gen
+    try:
+        pmids = _scan_pmids(hint=_PMID_INDEX)
+    except Exception:
+        # 索引尚未建好（后台建索引中）或名字不符时 hint 会报错：退回普通全表扫描
+        pmids = _scan_pmids(hint=None)
+    # 扫描期间若有写入触发 invalidate_cache，这份结果可能已过时：本次照常返回，但不发布
+    if _PMIDS_TTL > 0 and gen == _pmids_gen:
+        _pmids_cache = (time.monotonic() + _PMIDS_TTL, pmids)
+    return pmids
+
+def iter_pmids() -> Tuple[str, ...]:
+    """Read-only view of all PMIDs: returns the cached tuple itself, no per-call copy."""
     if abstracts_col is None:
         raise RuntimeError("MongoDB is not configured (MONGO_URI missing).")
     try:
-        return [str(d.get("pmid")) for d in abstracts_col.find({}, {"pmid": 1}) if d.get("pmid")]
+        return _pmid_snapshot()
     except Exception:
-        return []
+        return ()
+
+def get_all_pmids() -> List[str]:
+    """Return all PMIDs as strings from MongoDB (a fresh list; use iter_pmids() to only read)."""
+    return list(iter_pmids())
 
 def sentence_count(abstract: Optional[Dict[str, Any]]) -> int:
     """Get sentence count for an abstract."""
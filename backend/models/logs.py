@@ -1,17 +1,26 @@
 # backend/models/logs.py
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
+import mmap
 import os
+import queue
+import re
+import sys
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..config import (
     REVIEW_LOGS_PATH,
     REWARD_PER_ABSTRACT,
     REWARD_PER_ASSERTION_ADD,
+    _env_float,
+    _env_int,
     get_logger,
 )
 try:
@@ -19,12 +28,62 @@ try:
     from ..models.db import logs_col  # type: ignore
 except Exception:  # pragma: no cover
     logs_col = None  # type: ignore
+try:
+    # Optional fast JSON codec; stdlib json is the fallback
+    import orjson  # type: ignore
+    _ORJSON_LINE_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+try:
+    # Cross-process append lock (POSIX only; gunicorn workers share the file)
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover
+    fcntl = None  # type: ignore
 
 logger = get_logger("models.logs")
 
+# Fallback writer lock where fcntl.flock is unavailable (see _append_records)
 _WRITE_LOCK = threading.RLock()
-_TAIL_BLOCK_SIZE = 4096
-_USE_FSYNC = str(os.environ.get("LOG_FSYNC", "1")).strip().lower() in ("1", "true", "yes")
+_NO_LOCK = contextlib.nullcontext()
+_TAIL_BLOCK_SIZE = 64 * 1024
+_SCAN_BLOCK_SIZE = 4 * 1024 * 1024  # 全量解析的分块大小：限制单块拷贝，同时摊薄切行开销
+_writev = getattr(os, "writev", None)
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):  # pragma: no cover
+    _IOV_MAX = 16
+_IOV_MAX = _IOV_MAX if _IOV_MAX > 0 else 16
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+# LOG_FSYNC: "1"/"true"/"yes"（默认）= 每次追加都等到落盘（group commit，与原行为一致）；
+# "deferred" = 延迟 fsync：最多每 LOG_FSYNC_INTERVAL_MS 或每 LOG_FSYNC_EVERY 条落盘一次，
+# 空闲时由定时器补一次，崩溃时最多丢失最近一个间隔内的记录（Mongo 仍是持久化主存储）；其它值 = 不 fsync
+def _fsync_mode(raw: str) -> str:
+    v = str(raw).strip().lower()
+    return "sync" if v in ("1", "true", "yes", "sync", "strict") else "deferred" if v == "deferred" else "off"
+
+_FSYNC_MODE = _fsync_mode(os.environ.get("LOG_FSYNC", "1"))
+_FSYNC_INTERVAL = max(0.0, _env_float("LOG_FSYNC_INTERVAL_MS", 200.0)) / 1000.0
+_FSYNC_EVERY = max(1, _env_int("LOG_FSYNC_EVERY", 64))
+# 追加写会带着文件长度一起刷，fdatasync 足够且省掉 mtime 等元数据刷盘
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+_SYNC_FLAGS = os.O_WRONLY | os.O_APPEND | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+# Group commit: per-path write tickets; one fsync covers every write completed before it
+_SYNC_CV = threading.Condition()
+_sync_state: Dict[str, List[Any]] = {}  # path -> [written, synced, leader_running]
+# Deferred fsync: path -> [pending_writes, last_fsync_monotonic, idle_timer]; guarded by _WRITE_LOCK
+_deferred_sync: Dict[str, List[Any]] = {}
+# Mongo 写入走后台批量线程：请求线程只入队，消费端一次 insert_many 一批
+_MONGO_QUEUE: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=10_000)
+_MONGO_BATCH_MAX = 500
+_MONGO_BATCH_WAIT = 0.05  # 秒：凑批的最长等待
+_MONGO_FLUSH_TIMEOUT = max(0.0, _env_float("LOG_MONGO_FLUSH_TIMEOUT", 5.0))  # 秒：读路径等待在途写入的上限
+# 入队/落库序号（单一消费者按 FIFO 处理，已落库的必是入队序列的前缀）；flush 只等调用前入队的记录
+_MONGO_CV = threading.Condition()
+_MONGO_PUT_LOCK = threading.Lock()  # 入队与序号分配保持同一顺序
+_mongo_enqueued = 0
+_mongo_done = 0
+_mongo_writer: Optional[threading.Thread] = None
+_mongo_writer_lock = threading.Lock()
 # 若外部未设置，默认回落到配置路径（不会覆盖 fixture 中的 monkeypatch）
 os.environ.setdefault("MANUAL_REVIEW_REVIEW_LOGS_PATH", str(REVIEW_LOGS_PATH))
 
@@ -35,13 +94,16 @@ os.environ.setdefault("MANUAL_REVIEW_REVIEW_LOGS_PATH", str(REVIEW_LOGS_PATH))
 def _ensure_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
+@lru_cache(maxsize=8)
+def _resolve_log_path(env_path: Optional[str], default: Path) -> Path:
+    # 以 (环境变量原值, 默认路径) 为键缓存 Path 对象：每次读写不再重新构造 Path；
+    # 测试里 setenv 换路径时键随之变化，不会拿到旧值
+    return Path(env_path) if env_path else Path(default)
+
 def _to_path(p: Optional[str | os.PathLike] = None) -> Path:
     if p is not None:
         return Path(p)
-    env_path = os.environ.get("MANUAL_REVIEW_REVIEW_LOGS_PATH")
-    if env_path:
-        return Path(env_path)
-    return Path(REVIEW_LOGS_PATH)
+    return _resolve_log_path(os.environ.get("MANUAL_REVIEW_REVIEW_LOGS_PATH"), REVIEW_LOGS_PATH)
 
 # ---------------------------------------------------------------------------
 # Timestamp helpers & record sanitize
@@ -53,68 +115,403 @@ def _to_float_ts(v: Any, *, default: Optional[float] = None) -> float:
     except Exception:
         return 0.0 if default is None else float(default)
 
+# raw -> sys.intern(raw.strip().lower())：action 只有少数几种取值、邮箱也只有审稿人那么多，
+# 命中后省掉逐条 strip/lower，且结果是同一个驻留对象；设上限防止异常输入撑大
+_LC_CACHE: Dict[str, str] = {}
+_LC_CACHE_MAX = 4096
+
+def _norm_lc(raw: Any) -> str:
+    if type(raw) is str:
+        s = _LC_CACHE.get(raw)
+        if s is None:
+            s = sys.intern(raw.strip().lower())
+            if len(_LC_CACHE) < _LC_CACHE_MAX:
+                _LC_CACHE[raw] = s
+        return s
+    return str(raw).strip().lower()
+
 def _sanitize_record(record: Dict[str, Any]) -> Dict[str, Any]:
     rec = dict(record) if isinstance(record, dict) else {}
-    now = time.time()
-    created = _to_float_ts(rec.get("created_at"), default=now)
+    # 调用方几乎总是自带 float 秒级 created_at：只有缺失/非法时才取当前时间。
+    # （保持 float 秒，不改成 time_ns 整数——已有日志与时间窗口过滤都按秒比较，混用单位会错序。）
+    created = rec.get("created_at")
+    if type(created) is not float:
+        try:
+            created = float(created)
+        except Exception:
+            created = time.time()
     rec["created_at"] = created
     rec.setdefault("timestamp", created)
     # Ensure action present and normalized for query
     if rec.get("action"):
         try:
-            rec["action"] = str(rec["action"]).strip().lower()
+            rec["action"] = _norm_lc(rec["action"])
         except Exception:
             pass
+    # 预先存好规范化的审稿人（首个非空 creator/reviewer/email），
+    # get_reviewer_logs 扫描时只做一次相等比较；有此字段即表示 action 也已规范化
+    try:
+        rec["actor_lc"] = _norm_lc(rec.get("creator") or rec.get("reviewer") or rec.get("email") or "")
+    except Exception:
+        pass
     return rec
 
 # ---------------------------------------------------------------------------
 # JSONL write
 # ---------------------------------------------------------------------------
 
-def log_review_action(record: Dict[str, Any], *, path: Optional[str | os.PathLike] = None) -> None:
-    p = _to_path(path)
-    _ensure_dir(p)
-    rec = _sanitize_record(record)
+def _attach_request_meta(recs: List[Dict[str, Any]]) -> None:
     # Best-effort operator/ip propagation
     try:
         from flask import request
-        if "ip" not in rec:
-            rec["ip"] = request.remote_addr
-        if "user_agent" not in rec:
-            rec["user_agent"] = request.headers.get("User-Agent", "")
+        ip = request.remote_addr
+        ua = request.headers.get("User-Agent", "")
     except Exception:
-        pass
-    data = json.dumps(rec, ensure_ascii=False)
+        return
+    for rec in recs:
+        rec.setdefault("ip", ip)
+        rec.setdefault("user_agent", ua)
 
-    with _WRITE_LOCK:
-        # Write to file (best-effort) for local dev
+def _encode_line(rec: Dict[str, Any]) -> bytes:
+    if orjson is not None:
         try:
-            with p.open("a", encoding="utf-8") as f:
-                f.write(data + "\n")
-                f.flush()
-                if _USE_FSYNC:
-                    os.fsync(f.fileno())
-        except Exception:
-            logger.debug("File log append failed; continuing with Mongo only")
-        # Write to Mongo (preferred for persistence)
-        if logs_col is not None:
+            # NON_STR_KEYS mirrors json.dumps key coercion (e.g. int sentence indices)
+            return orjson.dumps(rec, option=_ORJSON_LINE_OPTS)
+        except TypeError:
+            pass  # unsupported types: let stdlib decide (and raise) as before
+    return (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+
+def _write_all(fd: int, lines: List[bytes]) -> None:
+    # 多行用 os.writev 一次系统调用交给内核，不先 b"".join 拷贝一遍；
+    # 超过 IOV_MAX、平台没有 writev 或发生短写时，剩余部分拼接后按 os.write 补完
+    done = 0
+    if len(lines) > 1 and _writev is not None and len(lines) <= _IOV_MAX:
+        done = _writev(fd, lines)
+        if done == sum(map(len, lines)):
+            return
+    view = memoryview(lines[0] if len(lines) == 1 else b"".join(lines))[done:]
+    while view:
+        # Short writes are rare on regular files; loop keeps the record whole
+        view = view[os.write(fd, view):]
+
+def _append_records(p: Path, lines: List[bytes], recs: List[Dict[str, Any]]) -> None:
+    """One open/write/fsync for all encoded lines, then queue the records for Mongo.
+
+    The lines are pre-encoded bytes written to an O_APPEND fd in a single
+    write/writev syscall (no text-layer buffering, encode or extra flush).
+    Only that write is serialized: by flock where available (per open file, so it
+    covers threads and worker processes alike), else by _WRITE_LOCK. fsync and
+    the Mongo enqueue run outside the lock so concurrent writers overlap. How
+    often the file is fsynced depends on LOG_FSYNC (see _group_fsync and
+    _deferred_fsync).
+    """
+    # Write to file (best-effort) for local dev
+    try:
+        fd = os.open(str(p), _APPEND_FLAGS, 0o644)
+        try:
+            with (_NO_LOCK if fcntl is not None else _WRITE_LOCK):
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    _write_all(fd, lines)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+            if _FSYNC_MODE == "sync":
+                _group_fsync(fd, str(p))
+            elif _FSYNC_MODE == "deferred":
+                _deferred_fsync(fd, str(p))
+        finally:
+            os.close(fd)
+    except Exception:
+        logger.debug("File log append failed; continuing with Mongo only")
+    # Write to Mongo (preferred for persistence): queued for the background batcher
+    if logs_col is not None and recs:
+        _enqueue_mongo(recs)
+
+def _group_fsync(fd: int, key: str) -> None:
+    """Return once a fsync issued after our write has completed (group commit).
+
+    fsync flushes the inode, not just this fd, so the first waiter becomes the
+    leader and syncs on behalf of every write already on the file; writers that
+    arrive meanwhile wait for the next round instead of each paying a barrier.
+    """
+    with _SYNC_CV:
+        st = _sync_state.setdefault(key, [0, 0, False])
+        st[0] += 1
+        ticket = st[0]
+        while st[1] < ticket:
+            if st[2]:
+                _SYNC_CV.wait()
+                continue
+            # 成为 leader：本轮覆盖目前为止所有已完成的写入
+            st[2] = True
+            target = st[0]
+            _SYNC_CV.release()
             try:
-                # Store original record; Mongo will handle ObjectId
-                logs_col.insert_one(rec)
-            except Exception:
-                logger.exception("Failed to append review log to Mongo")
+                _fdatasync(fd)
+            finally:
+                _SYNC_CV.acquire()
+                st[2] = False
+                _SYNC_CV.notify_all()
+            st[1] = max(st[1], target)
+
+def _deferred_fsync(fd: int, key: str) -> None:
+    """Sync only every _FSYNC_EVERY writes or _FSYNC_INTERVAL seconds, whichever comes first.
+
+    Writes in between return without a barrier; an idle timer syncs whatever is
+    still pending once the interval passes with no further writes.
+    """
+    now = time.monotonic()
+    with _WRITE_LOCK:
+        st = _deferred_sync.setdefault(key, [0, now, None])
+        st[0] += 1
+        due = st[0] >= _FSYNC_EVERY or now - st[1] >= _FSYNC_INTERVAL
+        if due:
+            st[0], st[1] = 0, now
+        elif st[2] is None:
+            st[2] = t = threading.Timer(_FSYNC_INTERVAL, _idle_fsync, (key,))
+            t.daemon = True
+            t.start()
+    if due:
+        _fdatasync(fd)
+
+def _idle_fsync(key: str) -> None:
+    with _WRITE_LOCK:
+        st = _deferred_sync.get(key)
+        if st is None:
+            return
+        st[2] = None
+        if not st[0]:
+            return
+        st[0], st[1] = 0, time.monotonic()
+    try:
+        fd = os.open(key, _SYNC_FLAGS)
+        try:
+            _fdatasync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        logger.debug("Deferred fsync of %s failed", key)
+
+def sync_pending_logs() -> None:
+    """fsync every log file with deferred writes still outstanding (registered with atexit)."""
+    with _WRITE_LOCK:
+        keys = [k for k, st in _deferred_sync.items() if st[0]]
+    for key in keys:
+        _idle_fsync(key)
+
+atexit.register(sync_pending_logs)
+
+def _insert_mongo(batch: List[Dict[str, Any]]) -> None:
+    try:
+        # Store original records; Mongo will handle ObjectId
+        if len(batch) == 1:
+            logs_col.insert_one(batch[0])
+        else:
+            logs_col.insert_many(batch, ordered=False)
+    except Exception:
+        logger.exception("Failed to append %d review log(s) to Mongo", len(batch))
 
-    # 写入后主动失效聚合缓存
+def _enqueue_mongo(recs: List[Dict[str, Any]]) -> None:
+    """Hand records to the background writer, in order.
+
+    Producers serialize on _MONGO_PUT_LOCK so queue order matches the sequence
+    numbers flush_pending_logs waits on. A full queue (Mongo slow or down)
+    applies backpressure for up to LOG_MONGO_FLUSH_TIMEOUT seconds; records
+    still not accepted are dropped from Mongo (they are in the JSONL file).
+    """
+    global _mongo_enqueued
+    _ensure_mongo_writer()
+    with _MONGO_PUT_LOCK:
+        for i, rec in enumerate(recs):
+            try:
+                _MONGO_QUEUE.put(rec, timeout=_MONGO_FLUSH_TIMEOUT)
+            except queue.Full:
+                logger.error("Mongo log queue full; %d review log(s) kept in the file only", len(recs) - i)
+                return
+            with _MONGO_CV:
+                _mongo_enqueued += 1
+
+def flush_pending_logs(timeout: Optional[float] = None) -> bool:
+    """Wait until every Mongo log record queued before this call has been inserted.
+
+    Only the background writer drains the queue, so inserts keep their queue
+    order. Mongo-backed readers call this first so a process reads its own
+    writes; the wait is capped at LOG_MONGO_FLUSH_TIMEOUT seconds (or
+    `timeout`) so a slow or unreachable Mongo cannot stall reads. Also runs at
+    exit. Returns False when the wait timed out.
+    """
+    if logs_col is None or _mongo_writer is None or _mongo_done >= _mongo_enqueued:
+        return True  # 本进程没有在途写入：不碰锁
+    with _MONGO_CV:
+        target = _mongo_enqueued
+        ok = _MONGO_CV.wait_for(lambda: _mongo_done >= target, _MONGO_FLUSH_TIMEOUT if timeout is None else timeout)
+    if not ok:
+        logger.warning("Timed out waiting for queued review logs to reach Mongo")
+    return ok
+
+def _mongo_writer_loop() -> None:
+    global _mongo_done
+    while True:
+        batch = [_MONGO_QUEUE.get()]
+        deadline = time.monotonic() + _MONGO_BATCH_WAIT
+        # 凑批：最多 _MONGO_BATCH_MAX 条或等待 _MONGO_BATCH_WAIT 秒
+        while len(batch) < _MONGO_BATCH_MAX:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            try:
+                batch.append(_MONGO_QUEUE.get(timeout=left))
+            except queue.Empty:
+                break
+        try:
+            _insert_mongo(batch)
+        finally:
+            with _MONGO_CV:
+                _mongo_done += len(batch)
+                _MONGO_CV.notify_all()
+
+def _ensure_mongo_writer() -> None:
+    global _mongo_writer
+    if _mongo_writer is not None:
+        return
+    with _mongo_writer_lock:
+        if _mongo_writer is None:
+            t = threading.Thread(target=_mongo_writer_loop, daemon=True, name="ReviewLogMongoWriter")
+            t.start()
+            atexit.register(flush_pending_logs)
+            _mongo_writer = t
+
+def _invalidate_after_append() -> None:
+    # 写入后主动失效聚合缓存（纯追加：文件快照可增量读取）
     try:
         from ..services.aggregation import invalidate_cache as _invalidate
-        _invalidate()
+        _invalidate(appended=True)
     except Exception:
         pass
 
+def log_review_action(record: Dict[str, Any], *, path: Optional[str | os.PathLike] = None) -> None:
+    p = _to_path(path)
+    _ensure_dir(p)
+    rec = _sanitize_record(record)
+    _attach_request_meta([rec])
+    data = _encode_line(rec)
+
+    _append_records(p, [data], [rec])
+    _invalidate_after_append()
+
+def log_review_actions(records: List[Dict[str, Any]], *, path: Optional[str | os.PathLike] = None) -> int:
+    """Append many records with a single open/write/fsync (Mongo inserts go through the batch writer).
+
+    Records that cannot be serialized are skipped and logged; returns the number written.
+    """
+    p = _to_path(path)
+    _ensure_dir(p)
+    sanitized = [_sanitize_record(r) for r in records]
+    _attach_request_meta(sanitized)
+    recs: List[Dict[str, Any]] = []
+    chunks: List[bytes] = []
+    for rec in sanitized:
+        try:
+            chunks.append(_encode_line(rec))
+        except Exception as e:
+            logger.error("Failed to encode review log: %s", e)
+            continue
+        recs.append(rec)
+    if not recs:
+        return 0
+
+    _append_records(p, chunks, recs)
+    _invalidate_after_append()
+    return len(recs)
+
 # ---------------------------------------------------------------------------
 # JSONL read
 # ---------------------------------------------------------------------------
 
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _scan_jsonl(p: Path, start: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse JSONL from byte offset `start` through a read-only mmap, block by block.
+
+    Each block ends on a newline and is split into lines in one C call, so the
+    per-line Python work is just the decode. Returns (records, end_offset). A
+    trailing line without a newline that does not parse (e.g. a write still in
+    flight) is not consumed, so a later scan from end_offset picks it up once
+    complete.
+    """
+    out: List[Dict[str, Any]] = []
+    append = out.append
+    fd = os.open(str(p), os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size <= start:
+            return out, size
+        mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        try:
+            while start < size:
+                nl = mm.rfind(b"\n", start, min(start + _SCAN_BLOCK_SIZE, size))
+                if nl == -1:
+                    nl = mm.find(b"\n", start + _SCAN_BLOCK_SIZE)
+                if nl == -1:
+                    # 末尾没有换行的残行：能解析就收下，否则留给下一次增量读取
+                    line = mm[start:size]
+                    if line.strip():
+                        try:
+                            obj = _json_loads(line)
+                        except Exception:
+                            break
+                        if isinstance(obj, dict):
+                            append(obj)
+                    start = size
+                    break
+                for line in mm[start:nl].split(b"\n"):
+                    if not line:
+                        continue
+                    try:
+                        obj = _json_loads(line)
+                    except Exception:
+                        continue  # 坏行/纯空白行跳过
+                    if isinstance(obj, dict):
+                        append(obj)
+                start = nl + 1
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+    return out, min(start, size)
+
+def _parse_jsonl_file(p: Path) -> List[Dict[str, Any]]:
+    """Parse a whole JSONL file (see _scan_jsonl)."""
+    return _scan_jsonl(p)[0]
+
+def _load_logs_mongo(limit: Optional[int] = None, *, flush: bool = True) -> Optional[List[Dict[str, Any]]]:
+    """Return logs from Mongo, or None when Mongo is unavailable.
+
+    flush=False skips waiting for this process's queued inserts (for callers
+    that already flushed before taking a lock).
+    """
+    if logs_col is None:
+        return None
+    if flush:
+        flush_pending_logs()
+    try:
+        if limit and limit > 0:
+            # 服务端倒序取最新 N 条（走 logs_created_at_idx），再翻回升序，不再拉全表后切片
+            cursor = logs_col.find({}, {"_id": 0}).sort([("created_at", -1), ("timestamp", -1)]).limit(limit)
+            docs = list(cursor)
+            docs.reverse()
+        else:
+            docs = list(logs_col.find({}, {"_id": 0}))
+        return [dict(d) for d in docs if isinstance(d, dict)]
+    except Exception:
+        logger.debug("Mongo load_logs failed; falling back to file")
+        return None
+
 def load_logs(*, path: Optional[str | os.PathLike] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """Load logs from Mongo when available; fallback to file on local dev.
 
@@ -122,68 +519,233 @@ def load_logs(*, path: Optional[str | os.PathLike] = None, limit: Optional[int]
     - Ensures consistent dict output.
     """
     # Prefer Mongo
-    if logs_col is not None:
-        try:
-            cursor = logs_col.find({}, {"_id": 0})
-            if limit and limit > 0:
-                cursor = logs_col.find({}, {"_id": 0}).sort([("created_at", 1), ("timestamp", 1)])  # ascending to keep order
-                docs = list(cursor)[-limit:]
-            else:
-                docs = list(cursor)
-            return [dict(d) for d in docs if isinstance(d, dict)]
-        except Exception:
-            logger.debug("Mongo load_logs failed; falling back to file")
+    docs = _load_logs_mongo(limit)
+    if docs is not None:
+        return docs
 
-    # Fallback to file
+    # Fallback to file：一次 stat 同时判断存在与否和空文件，不再 exists() + 打开
     p = _to_path(path)
-    if not p.exists():
+    try:
+        size = p.stat().st_size
+    except OSError:
+        # 不存在、父路径是文件（NotADirectoryError）等：与 load_logs_snapshot 一样当作无日志
+        return []
+    if size == 0:
         return []
 
     out: List[Dict[str, Any]] = []
+    # 只兜住 IO 错误（文件在 stat 之后被删/换掉等竞态）；逐行的解码错误在下面按行跳过，
+    # 其它异常照常抛出，不再被吞成空列表
     try:
         if not limit or limit <= 0:
-            with p.open("r", encoding="utf-8") as f:
-                for line in f:
-                    s = line.strip()
-                    if not s:
-                        continue
-                    try:
-                        obj = json.loads(s)
-                        if isinstance(obj, dict):
-                            out.append(obj)
-                    except Exception:
-                        continue
+            out = _parse_jsonl_file(p)
         else:
             with p.open("rb") as f:
                 f.seek(0, os.SEEK_END)
                 size = f.tell()
-                data = b""
-                lines = []
-                while size > 0 and len(lines) <= limit:
+                # 从尾部按块倒读，只数换行（bytes.count 在 C 里完成）；
+                # 块先收进列表，够数后一次拼接、一次切分，避免每块都重拼重切的 O(n²)
+                blocks: List[bytes] = []
+                newlines = last = 0
+                while size > 0 and newlines <= limit:
                     step = min(_TAIL_BLOCK_SIZE, size)
                     size -= step
                     f.seek(size)
-                    data = f.read(step) + data
-                    lines = data.splitlines()
-            for line in [ln.decode("utf-8", errors="ignore") for ln in lines[-limit:]]:
-                s = line.strip()
-                if not s:
-                    continue
+                    chunk = f.read(step)
+                    blocks.append(chunk)
+                    last = chunk.count(b"\n")
+                    newlines += last
+                if newlines > limit:
+                    # 最旧的块里用 rfind（memchr）倒数到第 limit+1 个换行，只保留其后的完整行，
+                    # 头部多余的字节不参与拼接
+                    oldest = blocks[-1]
+                    pos = len(oldest)
+                    for _ in range(limit + 1 - (newlines - last)):
+                        pos = oldest.rfind(b"\n", 0, pos)
+                    blocks[-1] = oldest[pos + 1:]
+                blocks.reverse()
+                # rsplit 只切末尾 limit 行
+                lines = b"".join(blocks).rstrip(b"\r\n").rsplit(b"\n", limit)[-limit:]
+    except FileNotFoundError:
+        return []
+    except OSError:
+        logger.exception("Failed to load logs from %s", str(p))
+        return []
+    if limit and limit > 0:
+        # 直接把 bytes 交给 orjson（见 _json_loads），不再逐行 decode + strip；
+        # 含非法 UTF-8 的行才回退到旧的 decode(errors="ignore") 路径
+        for ln in lines:
+            if not ln.strip():
+                continue
+            try:
+                obj = _json_loads(ln)
+            except Exception:
                 try:
-                    obj = json.loads(s)
-                    if isinstance(obj, dict):
-                        out.append(obj)
+                    obj = json.loads(ln.decode("utf-8", errors="ignore"))
                 except Exception:
                     continue
+            if isinstance(obj, dict):
+                out.append(obj)
+    return out
+
+def load_logs_snapshot(
+    *, path: Optional[str | os.PathLike] = None, flush: bool = True,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """Load all logs like load_logs(), also reporting the file offset consumed.
+
+    The offset is None when the logs came from Mongo. For the file fallback it is
+    the byte position after the last parsed line; pass it to read_logs_from() to
+    pick up records appended since. With flush=False the Mongo read does not wait
+    for queued inserts; call flush_pending_logs() first, outside any lock.
+    """
+    docs = _load_logs_mongo(flush=flush)
+    if docs is not None:
+        return docs, None
+    p = _to_path(path)
+    if not p.exists():
+        return [], 0
+    try:
+        return _scan_jsonl(p)
     except Exception:
         logger.exception("Failed to load logs from %s", str(p))
-        return []
-    return out
+        return [], 0
+
+def read_logs_from(offset: int, *, path: Optional[str | os.PathLike] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """File-only: parse records appended after byte `offset`; returns (records, new_offset)."""
+    return _scan_jsonl(_to_path(path), offset)
 
 # ---------------------------------------------------------------------------
 # Reviewer-scoped helpers & stats
 # ---------------------------------------------------------------------------
 
+def _reviewer_match(
+    email_norm: str,
+    actions_lc: Optional[Set[str]],
+    since: Optional[float],
+    until: Optional[float],
+) -> Dict[str, Any]:
+    # actor_lc / action 在写入时已规范化（_sanitize_record），精确匹配即可走
+    # db.ensure_indexes 中的 reviewer_logs_actor_idx；无 actor_lc 的旧记录按原始
+    # creator/reviewer/email 大小写、空白不敏感地匹配，action 与“首个非空 actor”由调用方复核
+    current: Dict[str, Any] = {"actor_lc": email_norm}
+    if actions_lc:
+        current["action"] = {"$in": sorted(actions_lc)}
+    loose = {"$regex": rf"^\s*{re.escape(email_norm)}\s*$", "$options": "i"}
+    legacy = {
+        "actor_lc": {"$exists": False},
+        "$or": [{f: loose} for f in ("creator", "reviewer", "email")],
+    }
+    q: Dict[str, Any] = {"$or": [current, legacy]}
+    rng: Dict[str, float] = {}
+    if since is not None:
+        rng["$gte"] = since
+    if until is not None:
+        rng["$lte"] = until
+    if rng:
+        q["created_at"] = rng
+    return q
+
+def _actor_fields(email_norm: str, actions_lc: Optional[Set[str]]) -> List[Dict[str, Any]]:
+    """Stages deriving normalized `_actor`/`_act` (legacy records included) and keeping this reviewer's."""
+    match: Dict[str, Any] = {"_actor": email_norm}
+    if actions_lc:
+        match["_act"] = {"$in": sorted(actions_lc)}
+    return [
+        {"$addFields": {
+            "_actor": {"$ifNull": ["$actor_lc", _lower_trim(_first_truthy("creator", "reviewer", "email"))]},
+            "_act": _lower_trim({"$ifNull": ["$action", ""]}),
+        }},
+        {"$match": match},
+    ]
+
+def _query_reviewer_logs_mongo(
+    email_norm: str,
+    actions_lc: Optional[Set[str]],
+    since: Optional[float],
+    until: Optional[float],
+    latest_per_action: bool = False,
+) -> Optional[List[Dict[str, Any]]]:
+    """Index-backed candidate set for get_reviewer_logs, or None when Mongo is unavailable.
+
+    With latest_per_action the server keeps only the newest matching record per
+    action, so only one document per action crosses the wire.
+    """
+    if logs_col is None:
+        return None
+    flush_pending_logs()
+    q = _reviewer_match(email_norm, actions_lc, since, until)
+    try:
+        if latest_per_action:
+            pipeline = [
+                {"$match": q},
+                *_actor_fields(email_norm, actions_lc),
+                {"$sort": {"created_at": -1}},
+                {"$group": {"_id": "$_act", "doc": {"$first": "$$ROOT"}}},
+                {"$replaceRoot": {"newRoot": "$doc"}},
+                {"$project": {"_id": 0, "_actor": 0, "_act": 0}},
+                {"$sort": {"created_at": 1}},
+            ]
+            cursor = logs_col.aggregate(pipeline)
+        else:
+            cursor = logs_col.find(q, {"_id": 0}).sort("created_at", 1)
+        return [d for d in cursor if isinstance(d, dict)]
+    except Exception:
+        logger.debug("Mongo reviewer log query failed; falling back to full scan")
+        return None
+
+_FALSY = [None, "", 0, False]
+
+def _first_truthy(*fields: str) -> Any:
+    """Aggregation expr mirroring Python `a or b or c` over document fields ("" when all falsy)."""
+    expr: Any = ""
+    for f in reversed(fields):
+        expr = {"$cond": [{"$in": [{"$ifNull": [f"${f}", None]}, _FALSY]}, expr, f"${f}"]}
+    return expr
+
+def _lower_trim(expr: Any) -> Dict[str, Any]:
+    return {"$toLower": {"$trim": {"input": {"$toString": expr}}}}
+
+def mongo_normalize_stage() -> Dict[str, Any]:
+    """Update-pipeline `$set` stage applying _sanitize_record's actor_lc/action rules server-side.
+
+    Used by scripts/backfill_log_actor_lc.py for records written before actor_lc existed.
+    """
+    return {"$set": {
+        "actor_lc": _lower_trim(_first_truthy("creator", "reviewer", "email")),
+        "action": {"$cond": [
+            {"$in": [{"$ifNull": ["$action", None]}, _FALSY]},
+            "$action",
+            _lower_trim("$action"),
+        ]},
+    }}
+
+def _reviewer_counts_mongo(email_norm: str, since: Optional[float], until: Optional[float]) -> Optional[Tuple[int, int]]:
+    """(distinct pmids, add count) for one reviewer in a single $facet round trip; None if Mongo is unavailable.
+
+    Applies the same rules as the Python path in get_stats_for_reviewer/get_reviewer_logs.
+    """
+    if logs_col is None or not email_norm:
+        return None
+    flush_pending_logs()
+    pipeline = [
+        {"$match": _reviewer_match(email_norm, None, since, until)},
+        *_actor_fields(email_norm, None),
+        {"$project": {"_id": 0, "pmid": _first_truthy("pmid", "abstract_id", "abs_id"), "action": "$_act"}},
+        {"$facet": {
+            "abstracts": [{"$match": {"pmid": {"$ne": ""}}}, {"$group": {"_id": {"$toString": "$pmid"}}}, {"$count": "n"}],
+            "adds": [{"$match": {"action": "add"}}, {"$count": "n"}],
+        }},
+    ]
+    try:
+        res = next(iter(logs_col.aggregate(pipeline)), None) or {}
+    except Exception:
+        logger.debug("Mongo reviewer stats aggregation failed; falling back to full scan")
+        return None
+    def _n(key: str) -> int:
+        rows = res.get(key) or []
+        return int(rows[0].get("n", 0)) if rows else 0
+    return _n("abstracts"), _n("adds")
+
 def get_reviewer_logs(
     email: str,
     *,
@@ -205,23 +767,39 @@ def get_reviewer_logs(
     if not email_norm:
         return []
 
-    logs = load_logs(path=path)
-    actions_lc: Optional[Set[str]] = {a.strip().lower() for a in actions} if actions else None
+    actions_lc: Optional[Set[str]] = {_norm_lc(a) for a in actions} if actions else None
+    since = _to_float_ts(since_ts) if since_ts is not None else None
+    until = _to_float_ts(until_ts) if until_ts is not None else None
+
+    # Mongo 可用时让索引先筛一遍（reviewer_logs_actor_idx），否则全量读取
+    logs = _query_reviewer_logs_mongo(
+        email_norm, actions_lc, since, until,
+        latest_per_action=bool(actions_lc) and since_ts is None and until_ts is None,
+    )
+    if logs is None:
+        logs = load_logs(path=path)
 
+    # 逐条复核同一套规则（首个非空 actor、action、时间窗口），两条路径结果一致
     filtered: List[Dict[str, Any]] = []
     for log in logs:
-        actor = ((log.get("creator") or log.get("reviewer") or log.get("email") or "")).strip().lower()
-        if actor != email_norm:
+        actor = log.get("actor_lc")
+        if actor is None:
+            # 旧记录（无 actor_lc）：现场规范化
+            actor = _norm_lc(log.get("creator") or log.get("reviewer") or log.get("email") or "")
+            if actor != email_norm:
+                continue
+            act = _norm_lc(log.get("action") or "")
+        elif actor != email_norm:
             continue
-
-        act = (log.get("action") or "").strip().lower()
+        else:
+            act = log.get("action") or ""
         if actions_lc and act not in actions_lc:
             continue
 
         ts = _to_float_ts(log.get("created_at", log.get("timestamp", 0)))
-        if since_ts is not None and ts < _to_float_ts(since_ts):
+        if since is not None and ts < since:
             continue
-        if until_ts is not None and ts > _to_float_ts(until_ts):
+        if until is not None and ts > until:
             continue
 
         filtered.append(log)
@@ -231,7 +809,9 @@ def get_reviewer_logs(
         seen_actions: Set[str] = set()
         dedup_reversed: List[Dict[str, Any]] = []
         for log in reversed(filtered):  # 从新到旧
-            act = (log.get("action") or "").strip().lower()
+            act = log.get("action") or ""
+            if "actor_lc" not in log:
+                act = _norm_lc(act)
             if act in seen_actions:
                 continue
             seen_actions.add(act)
@@ -256,18 +836,26 @@ def get_stats_for_reviewer(
       - assertions_added：action == "add" 的条目数
       - commission：抽象件数*单价 + 新增断言数*单价
     """
-    logs = get_reviewer_logs(email, path=path, since_ts=since_ts, until_ts=until_ts)
-
-    abs_ids: Set[str] = set()
-    adds = 0
-    for log in logs:
-        pmid = log.get("pmid") or log.get("abstract_id") or log.get("abs_id")
-        if pmid:
-            abs_ids.add(str(pmid))
-        if (log.get("action") or "").strip().lower() == "add":
-            adds += 1
+    counts = _reviewer_counts_mongo(
+        (email or "").strip().lower(),
+        _to_float_ts(since_ts) if since_ts is not None else None,
+        _to_float_ts(until_ts) if until_ts is not None else None,
+    )
+    if counts is not None:
+        reviewed_abstracts, adds = counts
+    else:
+        logs = get_reviewer_logs(email, path=path, since_ts=since_ts, until_ts=until_ts)
+
+        abs_ids: Set[str] = set()
+        adds = 0
+        for log in logs:
+            pmid = log.get("pmid") or log.get("abstract_id") or log.get("abs_id")
+            if pmid:
+                abs_ids.add(str(pmid))
+            if _norm_lc(log.get("action") or "") == "add":
+                adds += 1
+        reviewed_abstracts = len(abs_ids)
 
-    reviewed_abstracts = len(abs_ids)
     commission = reviewed_abstracts * per_abstract_rate + adds * per_assertion_add_rate
 
     return {
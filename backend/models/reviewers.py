@@ -5,28 +5,44 @@ import json
 import os
 import tempfile
 import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..config import REVIEWERS_JSON, get_logger
 
 logger = get_logger("models.reviewers")
 
 _LOCK = threading.RLock()
+# MANUAL_REVIEW_REVIEWERS_NOSYNC=1 跳过 fsync（批量导入用；崩溃时可能丢失最近一次写入）
+_NO_SYNC = str(os.environ.get("MANUAL_REVIEW_REVIEWERS_NOSYNC", "")).strip().lower() in ("1", "true", "yes", "on")
+# 临时文件只需数据落盘；rename 的持久性由随后对目录的 fsync 保证
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+# Parsed reviewers file keyed by (path, inode, mtime_ns, size), plus its email index; see _load_raw_file
+_CACHE: Dict[str, Any] = {"key": None, "data": [], "by_email": {}, "views": {}}
 
 # Try Mongo-backed storage; fall back to file when Mongo is unavailable
 try:
     from ..models.db import reviewers_col  # type: ignore
 except Exception:  # pragma: no cover
     reviewers_col = None  # type: ignore
+try:
+    # Optional fast JSON codec; stdlib json is the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 # ---------------------------------------------------------------------------
 # Path helpers (file fallback)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=8)
+def _resolve_file_path(env_path: Optional[str], default: Path) -> Path:
+    # 与 logs._resolve_log_path 相同：按 (环境变量原值, 默认路径) 缓存 Path，测试 setenv 换路径时键随之变化
+    return Path(env_path) if env_path else Path(default)
+
 def _file_path() -> Path:
-    env = os.environ.get("MANUAL_REVIEW_REVIEWERS_JSON")
-    return Path(env) if env else Path(REVIEWERS_JSON)
+    return _resolve_file_path(os.environ.get("MANUAL_REVIEW_REVIEWERS_JSON"), REVIEWERS_JSON)
 
 def _ensure_file(path: Optional[Path] = None) -> Path:
     p = path or _file_path()
@@ -60,26 +76,91 @@ def _normalize_record(r: Dict[str, Any]) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 def _load_raw_file() -> List[Dict[str, Any]]:
-    p = _ensure_file()
+    """Parsed reviewers file, re-read only when its stat signature changes.
+
+    Callers hold _LOCK; the returned list is shared, and any caller that
+    mutates it writes through _atomic_write_file, which drops the cache.
+    """
+    p = _file_path()
     try:
-        text = p.read_text(encoding="utf-8")
-        data = json.loads(text)
-        return data if isinstance(data, list) else []
+        st = p.stat()
+    except FileNotFoundError:
+        st = _ensure_file(p).stat()
+    # os.replace 换 inode；同 inode 原地改写则看 mtime_ns/size
+    key = (str(p), st.st_ino, st.st_mtime_ns, st.st_size)
+    if _CACHE["key"] == key:
+        return _CACHE["data"]
+    try:
+        # orjson 直接解析 bytes，省掉 decode；缺失时回落 stdlib
+        raw = p.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        data = data if isinstance(data, list) else []
     except Exception:
         logger.exception("Failed to read reviewers file: %s", str(p))
         return []
+    _CACHE["key"], _CACHE["data"], _CACHE["by_email"], _CACHE["views"] = key, data, _index_by_email(data), {}
+    return data
+
+def _index_by_email(data: List[Any]) -> Dict[str, Dict[str, Any]]:
+    # 首条匹配优先，与原先的线性扫描一致
+    idx: Dict[str, Dict[str, Any]] = {}
+    for r in data:
+        if isinstance(r, dict):
+            idx.setdefault(_normalize_email(r.get("email")), r)
+    return idx
+
+def _load_by_email(data: Optional[List[Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """email -> raw record of `data` (default: the reviewers file); records are shared, not copied."""
+    if data is None:
+        data = _load_raw_file()
+    return _CACHE["by_email"] if _CACHE["data"] is data else _index_by_email(data)
+
+def _invalidate_cache() -> None:
+    _CACHE["key"] = None
+
+def _dump_json(data: List[Dict[str, Any]]) -> bytes:
+    # 与 json.dump(ensure_ascii=False, indent=2) 同样的 UTF-8 缩进输出
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # unsupported types: let stdlib decide (and raise) as before
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _fsync_dir(d: Path) -> None:
+    # 让 os.replace 的目录项变更落盘；不支持打开目录的平台（Windows）直接跳过
+    try:
+        fd = os.open(str(d), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 def _atomic_write_file(data: List[Dict[str, Any]]) -> None:
     p = _ensure_file()
     tmp_fd, tmp_path = tempfile.mkstemp(prefix="reviewers.", suffix=".tmp", dir=str(p.parent))
     os.close(tmp_fd)
     try:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
+        with open(tmp_path, "wb") as f:
+            f.write(_dump_json(data))
+            if not _NO_SYNC:
+                f.flush()
+                _fdatasync(f.fileno())
         os.replace(tmp_path, p)
+        if not _NO_SYNC:
+            _fsync_dir(p.parent)
+        # 刚写出的内容就是 data：直接记为缓存，批量 add 时下一次调用不必重新解析
+        st = p.stat()
+        _CACHE["key"], _CACHE["data"], _CACHE["by_email"], _CACHE["views"] = (
+            (str(p), st.st_ino, st.st_mtime_ns, st.st_size), data, _index_by_email(data), {},
+        )
     except Exception:
+        # 调用方可能已改动缓存里的列表：让下次读取重新解析
+        _invalidate_cache()
         logger.exception("Failed to write reviewers file atomically: %s", str(p))
         raise
     finally:
@@ -120,11 +201,37 @@ def _write_db(items: List[Dict[str, Any]]) -> None:
 # Public API
 # ---------------------------------------------------------------------------
 
+def _cached_view(data: List[Any], name: str, build: Callable[[List[Any]], Tuple[Dict[str, Any], ...]]) -> List[Dict[str, Any]]:
+    """Derived view of the cached file data, built once per reload.
+
+    Returns a fresh list (callers may sort/filter it) over shared, read-only records.
+    Data that is not the cached file contents (Mongo, read errors) is built each call.
+    """
+    if _CACHE["data"] is not data:
+        return list(build(data))
+    views = _CACHE["views"]
+    view = views.get(name)
+    if view is None:
+        view = views[name] = build(data)
+    return list(view)
+
+def _normalized(data: List[Any]) -> Tuple[Dict[str, Any], ...]:
+    return tuple(_normalize_record(r) for r in data if isinstance(r, dict))
+
+def _deduped_sorted(data: List[Any]) -> Tuple[Dict[str, Any], ...]:
+    dedup: Dict[str, Dict[str, Any]] = {}
+    for r in data:
+        if not isinstance(r, dict):
+            continue
+        email = _normalize_email(r.get("email"))
+        if not email:
+            continue
+        dedup[email] = _normalize_record(r)
+    return tuple(sorted(dedup.values(), key=lambda r: r.get("email") or ""))
+
 def load_reviewers() -> List[Dict[str, Any]]:
     with _LOCK:
-        raw = _load_raw_db()
-        out = [_normalize_record(r) for r in raw if isinstance(r, dict)]
-        return out
+        return _cached_view(_load_raw_db(), "normalized", _normalized)
 
 def save_reviewers(reviewers: List[Dict[str, Any]]) -> None:
     with _LOCK:
@@ -132,18 +239,7 @@ def save_reviewers(reviewers: List[Dict[str, Any]]) -> None:
 
 def get_all_reviewers() -> List[Dict[str, Any]]:
     with _LOCK:
-        data = _load_raw_db()
-        dedup: Dict[str, Dict[str, Any]] = {}
-        for r in data:
-            if not isinstance(r, dict):
-                continue
-            email = _normalize_email(r.get("email"))
-            if not email:
-                continue
-            dedup[email] = _normalize_record(r)
-        out = list(dedup.values())
-        out.sort(key=lambda r: r.get("email") or "")
-        return out
+        return _cached_view(_load_raw_db(), "all", _deduped_sorted)
 
 def get_reviewer_by_email(email: str) -> Optional[Dict[str, Any]]:
     email_n = _normalize_email(email)
@@ -156,12 +252,8 @@ def get_reviewer_by_email(email: str) -> Optional[Dict[str, Any]]:
         except Exception:
             pass
     with _LOCK:
-        for r in _load_raw_file():
-            if not isinstance(r, dict):
-                continue
-            if _normalize_email(r.get("email")) == email_n:
-                return _normalize_record(r)
-    return None
+        r = _load_by_email().get(email_n)
+        return _normalize_record(r) if r is not None else None
 
 def add_reviewer(
     email: str,
@@ -184,11 +276,8 @@ def add_reviewer(
             pass
     with _LOCK:
         data = _load_raw_file()
-        for r in data:
-            if not isinstance(r, dict):
-                continue
-            if _normalize_email(r.get("email")) == email_n:
-                raise ValueError("reviewer already exists")
+        if email_n in _load_by_email(data):
+            raise ValueError("reviewer already exists")
         data.append(rec)
         _atomic_write_file(data)
 
@@ -220,26 +309,20 @@ def update_reviewer(email: str, fields: Dict[str, Any]) -> None:
 
     with _LOCK:
         data = _load_raw_file()
-        found = False
-        for r in data:
-            if not isinstance(r, dict):
-                continue
-            if _normalize_email(r.get("email")) == email_n:
-                for k, v in fields.items():
-                    if k not in allowed:
-                        continue
-                    if k == "role":
-                        r[k] = _normalize_role(v)
-                    elif k == "active":
-                        r[k] = bool(v)
-                    elif k == "name":
-                        r[k] = (v or "").strip()
-                    else:
-                        r[k] = str(v if v is not None else "")
-                found = True
-                break
-        if not found:
+        r = _load_by_email(data).get(email_n)
+        if r is None:
             raise ValueError("reviewer not found")
+        for k, v in fields.items():
+            if k not in allowed:
+                continue
+            if k == "role":
+                r[k] = _normalize_role(v)
+            elif k == "active":
+                r[k] = bool(v)
+            elif k == "name":
+                r[k] = (v or "").strip()
+            else:
+                r[k] = str(v if v is not None else "")
         _atomic_write_file(data)
 
 def delete_reviewer(email: str) -> None:
@@ -254,14 +337,11 @@ def delete_reviewer(email: str) -> None:
             pass
     with _LOCK:
         data = _load_raw_file()
-        new_data = []
-        removed = False
-        for r in data:
-            if not isinstance(r, dict):
-                continue
-            if _normalize_email(r.get("email")) == email_n:
-                removed = True
-                continue
-            new_data.append(r)
-        if removed:
-            _atomic_write_file(new_data)
\ No newline at end of file
+        if email_n not in _load_by_email(data):
+            return
+        # 只有确实命中时才重建列表（可能有重复邮箱，全部删除）
+        new_data = [
+            r for r in data
+            if isinstance(r, dict) and _normalize_email(r.get("email")) != email_n
+        ]
+        _atomic_write_file(new_data)
\ No newline at end of file
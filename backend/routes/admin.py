@@ -5,6 +5,11 @@ from pathlib import Path
 import json
 import time
 import os
+try:  # 上传预校验只需判断每行能否解析，orjson 更快；缺失时用标准库
+    import orjson as _orjson
+    _json_check = _orjson.loads
+except ImportError:  # pragma: no cover
+    _json_check = json.loads
 
 from backend.config import (
     ABSTRACTS_PATH,
@@ -18,10 +23,9 @@ try:
     from backend.models.db import reviewers_col  # type: ignore
 except Exception:
     reviewers_col = None  # type: ignore
-from backend.services.import_service import start_import_job, get_import_progress
 from backend.models.logs import log_review_action
 from backend.services.stats import compute_platform_analytics
-from backend.services.aggregation import find_assertion_conflicts
+from backend.services.aggregation import get_conflict_overview
 
 admin_api = Blueprint("admin_api", __name__, url_prefix="/api/admin")
 
@@ -40,11 +44,17 @@ def _count_jsonl(p: Path) -> int:
     except Exception:
         return 0
 
-@admin_api.get("/stats")
-def admin_stats():
-    guard = _require_admin_resp()
-    if guard:
-        return guard
+# Abstract/reviewer totals change rarely; dashboards poll /stats every few seconds
+_STATS_TTL = 5.0
+_stats_cache: dict = {"ts": 0.0, "val": None}
+
+
+def _entity_totals() -> tuple:
+    """(total_abstracts, total_reviewers), cached for _STATS_TTL seconds."""
+    now = time.monotonic()
+    if _stats_cache["val"] is not None and now - _stats_cache["ts"] < _STATS_TTL:
+        return _stats_cache["val"]
+
     # Prefer MongoDB for authoritative counts; fall back to file-based count
     try:
         total_abstracts = int(abstracts_col.count_documents({}))
@@ -69,14 +79,26 @@ def admin_stats():
         except Exception:
             pass
 
+    _stats_cache["ts"], _stats_cache["val"] = now, (total_abstracts, total_reviewers)
+    return total_abstracts, total_reviewers
+
+
+@admin_api.get("/stats")
+def admin_stats():
+    guard = _require_admin_resp()
+    if guard:
+        return guard
+    total_abstracts, total_reviewers = _entity_totals()
+
     # 如需真实统计可解析 REVIEW_LOGS_PATH；这里给出占位
     reviewed_count = 0
     reviewed_ratio = round((reviewed_count / total_abstracts) * 100, 1) if total_abstracts else 0.0
 
     # Compute arbitration queue size (number of conflicted assertions)
+    # (overview counts the same CONFLICT groups, with per-PMID counts cached
+    # until that PMID's logs change — no TTL needed here)
     try:
-        conflicts_list = find_assertion_conflicts()
-        arbitration_count = len(conflicts_list)
+        arbitration_count = int(get_conflict_overview()["conflicts"])
     except Exception:
         arbitration_count = 0
 
@@ -103,7 +125,7 @@ def admin_export_snapshot():
         return guard
 
     # simple second confirmation gate
-    confirm = request.json.get("confirm") if request.is_json else request.form.get("confirm")
+    confirm = (request.get_json(silent=True) or {}).get("confirm") if request.is_json else request.form.get("confirm")
     if str(confirm).lower() not in ("1", "true", "yes"): 
         return jsonify({"success": False, "message": "Confirmation required"}), 400
 
@@ -116,7 +138,7 @@ def admin_export_snapshot():
         from io import BytesIO
         import json
         from backend.services.aggregation import (
-            get_all_pmids,
+            iter_pmids,
             aggregate_final_decisions_for_pmid,
             _pmids_from_logs as _agg_pmids_from_logs,  # fallback to logs when DB is unavailable
             _load_raw_logs as _agg_load_raw_logs,
@@ -127,7 +149,7 @@ def admin_export_snapshot():
             finals = []
             # Prefer DB PMIDs but gracefully fall back to PMIDs parsed from logs
             try:
-                pmids = list(get_all_pmids())
+                pmids = list(iter_pmids())
             except Exception:
                 try:
                     pmids = _agg_pmids_from_logs(_agg_load_raw_logs())
@@ -206,7 +228,7 @@ def admin_upload_abstracts():
         return guard
 
     # second confirmation gate
-    confirm = request.form.get("confirm") or (request.json.get("confirm") if request.is_json else None)
+    confirm = request.form.get("confirm") or ((request.get_json(silent=True) or {}).get("confirm") if request.is_json else None)
     if str(confirm).lower() not in ("1", "true", "yes"):
         return jsonify({"success": False, "message": "Confirmation required"}), 400
 
@@ -230,14 +252,14 @@ def admin_upload_abstracts():
     invalid_lines = 0
     total_lines = 0
     try:
-        with saved_path.open("r", encoding="utf-8") as fh:
+        with saved_path.open("rb") as fh:
             for line in fh:
                 s = line.strip()
                 if not s:
                     continue
                 total_lines += 1
                 try:
-                    json.loads(s)
+                    _json_check(s)
                 except Exception:
                     invalid_lines += 1
         if total_lines == 0 or invalid_lines > 0 and invalid_lines / max(1, total_lines) > 0.25:
@@ -252,6 +274,8 @@ def admin_upload_abstracts():
 
     # run import with retries (up to 3 attempts for failed entries)
     try:
+        # Deferred: import_service pulls in the pydantic schemas, only needed here
+        from backend.services.import_service import start_import_job
         job_id = start_import_job(str(saved_path), str(err_log))
     except Exception as e:
         return jsonify({"success": False, "message": f"Failed to start import: {e}"}), 500
@@ -282,6 +306,7 @@ def admin_import_progress(job_id: str):
     if guard:
         return guard
     try:
+        from backend.services.import_service import get_import_progress
         progress = get_import_progress(job_id)
         if not progress:
             return jsonify({"success": False, "message": "Job not found"}), 404
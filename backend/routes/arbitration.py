@@ -44,10 +44,11 @@ def api_arbitration_queue():
     limit_int = int(limit) if (limit and limit.isdigit()) else None
 
     try:
-        # 关键：显式失效聚合缓存，避免“刚写完看不见”的情况
+        # 关键：避免“刚写完看不见”。文件快照按 stat 自动增量刷新，
+        # appended=True 只整体丢弃 Mongo 快照，保留可复用的聚合缓存
         try:
             from ..services.aggregation import invalidate_cache as _invalidate_agg
-            _invalidate_agg()
+            _invalidate_agg(appended=True)
         except Exception:
             pass
 
@@ -158,7 +159,7 @@ def api_arbitration_queue_compat():
         # 同样先失效缓存，保持行为一致
         try:
             from ..services.aggregation import invalidate_cache as _invalidate_agg
-            _invalidate_agg()
+            _invalidate_agg(appended=True)
         except Exception:
             pass
 
@@ -7,7 +7,7 @@ import time
 import json
 
 from ..services.aggregation import export_final_consensus, aggregate_final_decisions_for_pmid  # 见下方说明
-from ..models.abstracts import get_all_pmids
+from ..models.abstracts import iter_abstracts, iter_pmids
 from ..models.logs import log_review_action
 from ..services.export_service import export_passed_assertions
 
@@ -22,7 +22,7 @@ def api_export_consensus():
         if download:
             # Build content in-memory and return as attachment
             finals = []
-            for pid in get_all_pmids():
+            for pid in iter_pmids():
                 finals.extend(aggregate_final_decisions_for_pmid(pid))
             buf = BytesIO()
             for rec in finals:
@@ -70,10 +70,9 @@ def api_export_passed():
         download = str(request.args.get("download", "0")).lower() in ("1", "true", "yes")
         if download:
             # Build content from Mongo directly, in-memory
-            from ..models.db import abstracts_col
             buf = BytesIO()
             total = 0
-            for abs_doc in abstracts_col.find({}):
+            for abs_doc in iter_abstracts(fields=("pmid", "sentences")):
                 pmid = abs_doc.get("pmid")
                 for s in abs_doc.get("sentences", []) or []:
                     sent_idx = s.get("sentence_index")
@@ -1,14 +1,19 @@
 # backend/routes/meta.py
 from __future__ import annotations
 
+import json
+
 from flask import Blueprint, jsonify, current_app
 from ..services.vocab import get_vocab_with_descriptions
 
 bp = Blueprint("meta_api", __name__, url_prefix="/api/meta")
 
+# Fixed payload, polled by the platform health check: encode once
+HEALTH_BODY = json.dumps({"success": True, "data": {"status": "ok"}}).encode("utf-8")
+
 @bp.get("/health")
 def health():
-    return jsonify({"success": True, "data": {"status": "ok"}}), 200
+    return current_app.response_class(HEALTH_BODY, mimetype="application/json"), 200
 
 @bp.get("/vocab")
 def vocab():
@@ -10,7 +10,7 @@ from flask import Blueprint, request, session, jsonify
 
 from ..services.assignment import assign_abstract_to_reviewer, release_expired_locks, release_assignment, touch_assignment
 from ..models.abstracts import get_abstract_by_id
-from ..models.logs import log_review_action, load_logs
+from ..models.logs import log_review_action, log_review_actions, load_logs
 from ..services.stats import get_stats_for_reviewer   # <-- 改为服务层
 from ..services.audit import audit_review_submission
 
@@ -161,7 +161,8 @@ def api_submit_review():
     if not email:
         return error_response("Not authenticated", status=401)
 
-    payload: Dict[str, Any] = request.get_json(force=True, silent=True) or {}
+    # Body is read exactly once here: skip caching it on the request
+    payload: Dict[str, Any] = request.get_json(force=True, silent=True, cache=False) or {}
 
     pmid = payload.get("pmid") or session.get("current_abs_id")
     if not pmid:
@@ -211,14 +212,12 @@ def api_submit_review():
                 )
             # Otherwise, proceed and record logs despite non-blocking issues
 
-        # Write logs (append-only)
+        # Write logs (append-only, one batched append)
         written = 0
-        for log in logs:
-            try:
-                log_review_action(log)
-                written += 1
-            except Exception as e:
-                logger.error("Failed to write individual log: %s", e)
+        try:
+            written = log_review_actions(logs)
+        except Exception as e:
+            logger.error("Failed to write review logs: %s", e)
 
         # Log a meta submission event for the abstract
         try:
@@ -0,0 +1,75 @@
+# backend/scripts/backfill_log_actor_lc.py
+"""One-off backfill: add the normalized ``actor_lc`` field to historical review logs.
+
+New records get ``actor_lc`` (and a normalized ``action``) in
+``models.logs._sanitize_record``. Older records are still found (Mongo falls
+back to an unindexed case-insensitive match on creator/reviewer/email, the
+JSONL path normalizes them on read), but only backfilled records use
+``reviewer_logs_actor_idx``. Optional; run it once (with the app stopped if you
+pass --file); use --no-mongo for file-only setups.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.models.logs import mongo_normalize_stage
+
+
+def _normalize(rec: Dict[str, Any]) -> bool:
+    if "actor_lc" in rec:
+        return False
+    rec["actor_lc"] = str(rec.get("creator") or rec.get("reviewer") or rec.get("email") or "").strip().lower()
+    if rec.get("action"):
+        rec["action"] = str(rec["action"]).strip().lower()
+    return True
+
+
+def backfill_mongo() -> int:
+    # 延迟导入：db 模块导入时就要求 MONGO_URI，只处理文件时不应依赖它
+    from backend.models.db import logs_col  # uses MONGO_URI/MONGO_DB_NAME from env
+
+    # 服务端管道更新：与 _sanitize_record 的规则一致（首个非空 actor、action 去空格转小写）
+    res = logs_col.update_many({"actor_lc": {"$exists": False}}, [mongo_normalize_stage()])
+    return int(res.modified_count)
+
+
+def backfill_file(path: Path) -> int:
+    # 写到临时文件再原子替换；坏行原样保留
+    changed = 0
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(path, "rb") as src, open(tmp, "wb") as dst:
+        for raw in src:
+            try:
+                rec = json.loads(raw)
+            except Exception:
+                dst.write(raw)
+                continue
+            if isinstance(rec, dict) and _normalize(rec):
+                changed += 1
+                raw = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+            dst.write(raw)
+    os.replace(tmp, path)
+    return changed
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Backfill actor_lc on historical review logs.")
+    parser.add_argument("--file", dest="file", help="Also rewrite this JSONL review log (stop the app first)")
+    parser.add_argument(
+        "--mongo", action=argparse.BooleanOptionalAction, default=True,
+        help="Backfill the Mongo logs collection (default); --no-mongo for file-only runs",
+    )
+    args = parser.parse_args(argv)
+
+    if args.mongo:
+        print(f"Mongo logs updated: {backfill_mongo()}")
+    if args.file:
+        print(f"File records updated: {backfill_file(Path(args.file))}")
+
+
+if __name__ == "__main__":
+    main()
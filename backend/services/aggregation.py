@@ -1,19 +1,27 @@
 # backend/services/aggregation.py
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import sys
 import threading
-from collections import defaultdict, Counter
-from enum import Enum
+from collections import OrderedDict, defaultdict
 from functools import lru_cache
+from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Iterable
 
 from ..config import REVIEW_LOGS_PATH, FINAL_EXPORT_PATH, get_logger
 from ..domain.assertions import make_assertion_id
-from ..models.abstracts import get_all_pmids, get_abstract_by_id
-from ..models.logs import load_logs  # Prefer Mongo-backed loader
+from ..models.abstracts import iter_pmids, get_abstract_by_id
+from ..models.logs import flush_pending_logs, load_logs_snapshot, read_logs_from  # Prefer Mongo-backed loader
+from ..models.logs import _resolve_log_path
+try:
+    # Optional fast JSON codec; stdlib json is the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 logger = get_logger("services.aggregation")
 
@@ -38,36 +46,202 @@ class ConsensusResult(str, Enum):
 # ---------- Internal state & helpers ----------------------------------------
 
 _log_file_lock = threading.RLock()
-_cached_log_mtime: Optional[float] = None
+_lock_depth = threading.local()  # _logs_locked 的重入层数（按线程）
+# (path, inode, size, mtime) of the log file when the snapshot was taken
+_cached_log_stat: Optional[Tuple[str, int, int, float]] = None
+# Byte offset consumed from the log file; None when the snapshot came from Mongo
+_cached_log_offset: Optional[int] = None
 _cached_parsed_logs: Optional[List[Dict[str, Any]]] = None
+_cached_by_pmid: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+
+class _LRU(OrderedDict):
+    """OrderedDict capped at `maxsize` entries; the least recently used is evicted first."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Derived per-PMID results; only valid for the current log snapshot.
+# Bounded so a full export or overview pass cannot pin every PMID's results.
+# Cached values are internal: public helpers hand out copies.
+_DERIVED_CACHE_MAX = 1024
+_groups_cache: "_LRU" = _LRU(_DERIVED_CACHE_MAX)  # pmid -> {assertion_key: logs}
+_summary_cache: "_LRU" = _LRU(_DERIVED_CACHE_MAX)  # (pmid, exact, min_reviewers) -> summary rows
+_conflict_count_cache: "_LRU" = _LRU(_DERIVED_CACHE_MAX)  # pmid -> CONFLICT group count
+# pmid -> {assertion_key: arbitrate/arbitrate_undo logs}, time-ascending
+_arbitration_cache: "_LRU" = _LRU(_DERIVED_CACHE_MAX)
+
+
+def _drop_derived_locked(pid: Optional[str] = None) -> None:
+    """Assume _log_file_lock is held. Drop derived results for one PMID (or all)."""
+    if pid is None:
+        _groups_cache.clear()
+        _summary_cache.clear()
+        _conflict_count_cache.clear()
+        _arbitration_cache.clear()
+        return
+    _groups_cache.pop(pid, None)
+    _conflict_count_cache.pop(pid, None)
+    _arbitration_cache.pop(pid, None)
+    for key in [k for k in _summary_cache if k[0] == pid]:
+        del _summary_cache[key]
 
 
 def _log_path() -> Path:
     """Mirror models.logs._to_path behavior: prefer env var for tests/overrides.
     Fallback to configured REVIEW_LOGS_PATH.
     """
-    env_path = os.environ.get("MANUAL_REVIEW_REVIEW_LOGS_PATH")
-    return Path(env_path) if env_path else Path(REVIEW_LOGS_PATH)
+    return _resolve_log_path(os.environ.get("MANUAL_REVIEW_REVIEW_LOGS_PATH"), REVIEW_LOGS_PATH)
 
 
-def _get_log_file_mtime() -> float:
+def _get_log_file_stat() -> Tuple[str, int, int, float]:
+    p = _log_path()
     try:
-        p = _log_path()
-        return p.stat().st_mtime if p.exists() else 0.0
+        st = p.stat()
+        return str(p), st.st_ino, st.st_size, st.st_mtime
     except Exception:
-        return 0.0
+        return str(p), 0, 0, 0.0
 
 
-def invalidate_cache() -> None:
-    """Invalidate raw log cache and per-PMID aggregation cache."""
-    global _cached_log_mtime, _cached_parsed_logs
+def invalidate_cache(*, appended: bool = False) -> None:
+    """Invalidate raw log cache and per-PMID aggregation cache.
+
+    appended=True signals a pure append to the log file (see log_review_action):
+    a file-backed snapshot is then kept and catches up by tail-reading on next
+    access, while a Mongo-backed snapshot is still dropped.
+    """
+    global _cached_log_stat, _cached_log_offset, _cached_parsed_logs, _cached_by_pmid
     with _log_file_lock:
-        _cached_log_mtime = None
+        if appended and _cached_log_offset is not None:
+            return
+        _cached_log_stat = None
+        _cached_log_offset = None
         _cached_parsed_logs = None
+        _cached_by_pmid = None
+        _drop_derived_locked()
+        _make_key.cache_clear()
+
+
+# Low-cardinality string fields repeated across many cached logs
+_INTERN_FIELDS = ("action", "creator", "reviewer", "subject_type", "object_type", "predicate")
+
+
+def _bucket_by_pmid(
+    logs: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """Normalized copies of `logs` (the loader's dicts are left untouched) and their pmid index."""
+    records: List[Dict[str, Any]] = []
+    by_pmid: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    intern = sys.intern
+    for log in logs:
+        rec = dict(log)
+        # Share one str object per distinct value across the cached snapshot
+        for k in _INTERN_FIELDS:
+            v = rec.get(k)
+            if type(v) is str:
+                rec[k] = intern(v)
+        pid = rec.get("pmid")
+        if pid is not None and not isinstance(pid, str):
+            # Normalize once at ingest so downstream code never re-coerces
+            pid = str(pid)
+        if type(pid) is str:
+            rec["pmid"] = pid = intern(pid)
+        records.append(rec)
+        by_pmid[str(pid)].append(rec)
+    return records, by_pmid
+
+
+def _tail_locked(stat: Tuple[str, int, int, float]) -> bool:
+    """Assume _log_file_lock is held. Merge records appended since the snapshot."""
+    global _cached_log_stat, _cached_log_offset, _cached_parsed_logs, _cached_by_pmid
     try:
-        aggregate_assertions_for_pmid.cache_clear()  # type: ignore[attr-defined]
+        new_logs, offset = read_logs_from(_cached_log_offset or 0, path=stat[0])
     except Exception:
-        pass
+        logger.exception("Incremental log read failed; doing a full reload")
+        return False
+
+    # Copy-on-write so lists handed out earlier are never mutated under callers
+    by_pmid = dict(_cached_by_pmid or {})
+    new_logs, new_by_pmid = _bucket_by_pmid(new_logs)
+    for pid, items in new_by_pmid.items():
+        by_pmid[pid] = by_pmid.get(pid, []) + items
+        _drop_derived_locked(pid)
+
+    _cached_log_stat = stat
+    _cached_log_offset = offset
+    _cached_parsed_logs = (_cached_parsed_logs or []) + new_logs
+    _cached_by_pmid = by_pmid
+    return True
+
+
+def _refresh_locked() -> None:
+    """Assume _log_file_lock is held. Bring logs and the pmid index up to date.
+
+    An unchanged log file keeps the snapshot; a file that only grew is tail-read
+    from the consumed offset; anything else (first load, Mongo-backed snapshot,
+    truncation, replacement) triggers a full reload.
+    """
+    global _cached_log_stat, _cached_log_offset, _cached_parsed_logs, _cached_by_pmid
+    stat = _get_log_file_stat()
+    prev = _cached_log_stat
+    if _cached_parsed_logs is not None and prev == stat:
+        return
+
+    if (
+        _cached_parsed_logs is not None
+        and _cached_log_offset is not None
+        and prev is not None
+        and prev[:2] == stat[:2]
+        and stat[2] > prev[2]
+        and _tail_locked(stat)
+    ):
+        return
+
+    try:
+        logs, offset = load_logs_snapshot(flush=False)  # _logs_locked 已在锁外 flush
+    except Exception:
+        logger.exception("Central log loader failed; returning empty logs")
+        logs, offset = [], None
+
+    _cached_log_stat = stat
+    _cached_log_offset = offset
+    _cached_parsed_logs, by_pmid = _bucket_by_pmid(logs)
+    _cached_by_pmid = dict(by_pmid)
+    # Groupings/summaries computed from the previous snapshot are stale now
+    _drop_derived_locked()
+
+
+@contextlib.contextmanager
+def _logs_locked():
+    """Hold _log_file_lock with the snapshot refreshed.
+
+    The outermost entry first waits for this process's queued Mongo log writes
+    without the lock, so a slow Mongo never stalls other readers behind it.
+    """
+    depth = getattr(_lock_depth, "n", 0)
+    if not depth:
+        flush_pending_logs()
+    with _log_file_lock:
+        _lock_depth.n = depth + 1
+        try:
+            _refresh_locked()
+            yield
+        finally:
+            _lock_depth.n = depth
 
 
 def _load_raw_logs() -> List[Dict[str, Any]]:
@@ -75,24 +249,17 @@ def _load_raw_logs() -> List[Dict[str, Any]]:
 
     This change ensures logs survive backend redeploys: the loader reads from
     the Mongo `logs` collection when available, falling back to the local file
-    only for dev. We keep a lightweight cache key using the file mtime so
+    only for dev. We keep a lightweight cache key using the file stat so
     existing invalidation continues to work for local-file scenarios.
     """
-    global _cached_log_mtime, _cached_parsed_logs
-    with _log_file_lock:
-        current_mtime = _get_log_file_mtime()
-        if _cached_parsed_logs is not None and _cached_log_mtime == current_mtime:
-            return _cached_parsed_logs
+    with _logs_locked():
+        return list(_cached_parsed_logs or [])
 
-        try:
-            logs = load_logs()  # Already returns a list[dict]
-        except Exception:
-            logger.exception("Central log loader failed; returning empty logs")
-            logs = []
 
-        _cached_log_mtime = current_mtime
-        _cached_parsed_logs = logs
-        return logs
+def _logs_for_pmid(pmid: str) -> List[Dict[str, Any]]:
+    """Return the cached logs of one PMID (index built once per log snapshot)."""
+    with _logs_locked():
+        return (_cached_by_pmid or {}).get(str(pmid), [])
 
 # ---------- Normalization & timestamps --------------------------------------
 
@@ -119,19 +286,34 @@ def _ts(log: Dict[str, Any]) -> float:
 
 # ---------- Grouping ---------------------------------------------------------
 
+# Memoized per 5-tuple: many logs of the same assertion share one key.
+# Keys are interned so every group/summary/arbitration dict holds the same object
+# (identity fast path on lookups), also across cache clears.
+# Cleared together with the log index in invalidate_cache.
+@lru_cache(maxsize=16384)
+def _make_key(*parts: str) -> str:
+    return sys.intern(make_assertion_id(*parts))
+
+
 def _content_key(log: Dict[str, Any]) -> str:
     """Generate stable content key (empty string if fields missing)."""
-    return make_assertion_id(
-        log.get("subject", ""),
-        log.get("subject_type", ""),
-        log.get("predicate", ""),
-        log.get("object", ""),
-        log.get("object_type", ""),
+    get = log.get
+    parts = (
+        get("subject", ""),
+        get("subject_type", ""),
+        get("predicate", ""),
+        get("object", ""),
+        get("object_type", ""),
     )
+    try:
+        return _make_key(*parts)
+    except TypeError:
+        # 非可哈希字段（如 list/dict）直接走未缓存路径
+        return make_assertion_id(*parts)
 
 
-def _group_logs_for_pmid_ordered(pmid: str, logs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-    """Time-ordered grouping algorithm:
+def _group_logs_for_pmid_ordered(logs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Time-ordered grouping of the logs of a single PMID (see _logs_for_pmid):
       1) If 'related_to' is present -> group by that id
       2) Else if 'assertion_id' is present -> group by that id
       3) Else if action == add -> group by content key and update last_add_key
@@ -142,34 +324,30 @@ def _group_logs_for_pmid_ordered(pmid: str, logs: List[Dict[str, Any]]) -> Dict[
 
     This keeps accepts/rejects without assertion_id attached to the latest prior add,
     preventing unrelated assertions from merging under empty keys.
+
+    Logs are sorted once here, so every returned group is already time-ascending.
     """
-    pmid_s = str(pmid)
-    filt = [l for l in logs if str(l.get("pmid")) == pmid_s]
-    # Sort by time ascending
-    filt.sort(key=_ts)
+    # Sort by time ascending (copy: the pmid bucket is shared cache state)
+    filt = sorted(logs, key=_ts)
 
     agg: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     last_add_key: Optional[str] = None
+    add = Action.ADD.value
 
     for log in filt:
-        action = _norm_action(log.get("action"))
-        rid = (log.get("related_to") or "").strip()
-        aid = (log.get("assertion_id") or "").strip()
-
-        ch = (log.get("content_hash") or "").strip()
-        if ch:
-            key = ch
-        elif rid:
-            key = rid
-        elif aid:
-            key = aid
-        else:
-            if action == Action.ADD.value:
+        get = log.get  # bound once per log; the loop below is lookup-heavy
+        action = _norm_action(get("action"))
+
+        key = (get("content_hash") or "").strip()
+        if not key:
+            key = (get("related_to") or "").strip() or (get("assertion_id") or "").strip()
+        if not key:
+            if action == add:
                 key = _content_key(log)
                 last_add_key = key or last_add_key
             else:
                 # Do we have enough content to compute a key?
-                has_content = any(log.get(k) for k in ("subject", "predicate", "object"))
+                has_content = get("subject") or get("predicate") or get("object")
                 if has_content:
                     key = _content_key(log)
                 elif last_add_key:
@@ -181,18 +359,101 @@ def _group_logs_for_pmid_ordered(pmid: str, logs: List[Dict[str, Any]]) -> Dict[
         agg[key].append(log)
 
         # Only update last_add_key for true 'add' actions
-        if action == Action.ADD.value and key:
+        if action == add and key:
             last_add_key = key
 
     return agg
 
 
-def _group_logs_by_assertion(pmid: str, logs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+def _group_logs_by_assertion(pmid: str) -> Dict[str, List[Dict[str, Any]]]:
     """Public entrypoint that wraps the ordered grouping."""
-    return _group_logs_for_pmid_ordered(pmid, logs)
+    return _group_logs_for_pmid_ordered(_logs_for_pmid(pmid))
 
 # ---------- Consensus Logic --------------------------------------------------
 
+# Review actions are tallied into a fixed-size count row instead of a Counter
+_ACTION_CODES: Dict[str, int] = {
+    Action.ACCEPT.value: 0,
+    Action.MODIFY.value: 1,
+    Action.REJECT.value: 2,
+    Action.UNCERTAIN.value: 3,
+    Action.ARBITRATE.value: 4,
+}
+_C_ACCEPT, _C_MODIFY, _C_REJECT, _C_UNCERTAIN, _C_ARBITRATE = range(5)
+
+
+def _tally(logs: List[Dict[str, Any]]) -> Tuple[List[int], int]:
+    """Single pass over one assertion's logs: (count row by action code, distinct supporters)."""
+    counts = [0, 0, 0, 0, 0]
+    supporters = set()
+    codes = _ACTION_CODES
+    for l in logs:
+        code = codes.get(_norm_action(l.get("action")))
+        if code is None:
+            continue
+        counts[code] += 1
+        if code <= _C_MODIFY:
+            who = (l.get("creator") or l.get("reviewer") or "").strip().lower()
+            if who:
+                supporters.add(who)
+    return counts, len(supporters)
+
+
+def _classify(counts: List[int], supporters: int, min_reviewers_for_consensus: int) -> ConsensusResult:
+    """Consensus status from a count row (content-match check is left to the caller)."""
+    if counts[_C_ARBITRATE]:
+        return ConsensusResult.ARBITRATED
+    rejects, uncertains = counts[_C_REJECT], counts[_C_UNCERTAIN]
+    if rejects or uncertains:
+        if not rejects and not counts[_C_ACCEPT] and not counts[_C_MODIFY]:
+            return ConsensusResult.UNCERTAIN
+        return ConsensusResult.CONFLICT
+    # Require decisions from distinct reviewers for consensus
+    if (counts[_C_ACCEPT] or counts[_C_MODIFY]) and supporters >= min_reviewers_for_consensus:
+        return ConsensusResult.CONSENSUS
+    # No review yet, or not enough distinct reviewers -> pending
+    return ConsensusResult.PENDING
+
+
+def _modify_contents_diverge(logs: List[Dict[str, Any]]) -> bool:
+    """True when the modify logs of a group carry more than one distinct content."""
+    contents = set()
+    for l in logs:
+        get = l.get
+        if _norm_action(get("action")) != Action.MODIFY.value:
+            continue
+        contents.add((
+            get("subject"),
+            get("subject_type"),
+            get("predicate"),
+            get("object"),
+            get("object_type"),
+            bool(get("negation", False)),
+        ))
+        if len(contents) > 1:
+            return True
+    return False
+
+
+def _decide(
+    logs: List[Dict[str, Any]],
+    require_exact_content_match: bool,
+    min_reviewers_for_consensus: int,
+) -> Tuple[ConsensusResult, Optional[bool]]:
+    """consensus_decision plus the modify-divergence flag when it had to be computed
+    (None otherwise), so callers explaining a conflict need not rebuild it."""
+    if not logs:
+        return ConsensusResult.PENDING, None
+
+    counts, supporters = _tally(logs)
+    status = _classify(counts, supporters, min_reviewers_for_consensus)
+
+    if status == ConsensusResult.CONSENSUS and require_exact_content_match and counts[_C_MODIFY] > 1:
+        diverged = _modify_contents_diverge(logs)
+        return (ConsensusResult.CONFLICT if diverged else status), diverged
+    return status, None
+
+
 def consensus_decision(
     logs: List[Dict[str, Any]],
     require_exact_content_match: bool = False,
@@ -204,68 +465,67 @@ def consensus_decision(
       3. If only accept/modify -> CONSENSUS if support >= threshold; when exact-match required and multiple modify disagree -> CONFLICT
       4. Otherwise -> UNCERTAIN or PENDING
     """
-    if not logs:
-        return ConsensusResult.PENDING
+    return _decide(logs, require_exact_content_match, min_reviewers_for_consensus)[0]
 
-    if any(_norm_action(l.get("action")) == Action.ARBITRATE.value for l in logs):
-        return ConsensusResult.ARBITRATED
+# ---------- Public API ------------------------------------------------------
 
-    allowed = {
-        Action.ACCEPT.value,
-        Action.MODIFY.value,
-        Action.REJECT.value,
-        Action.UNCERTAIN.value,
-    }
-    review_actions = [_norm_action(l.get("action")) for l in logs if _norm_action(l.get("action")) in allowed]
+def _groups_locked(pid: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Assume _logs_locked() is held. Cached grouping of one PMID (shared; do not mutate)."""
+    groups = _groups_cache.get(pid)
+    if groups is None:
+        groups = _groups_cache[pid] = _group_logs_by_assertion(pid)
+    return groups
 
-    if not review_actions:
-        return ConsensusResult.PENDING
 
-    counter = Counter(review_actions)
+def aggregate_assertions_for_pmid(pmid: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Aggregate logs for a PMID by lifecycle key (ordered algorithm).
 
-    if counter.get(Action.REJECT.value, 0) > 0 or counter.get(Action.UNCERTAIN.value, 0) > 0:
-        if counter.get(Action.UNCERTAIN.value, 0) == len(review_actions) and counter.get(Action.REJECT.value, 0) == 0:
-            return ConsensusResult.UNCERTAIN
-        return ConsensusResult.CONFLICT
+    Cached per log snapshot; the cache is dropped whenever the logs reload.
+    Returns fresh dict/lists over the cached log records.
+    """
+    with _logs_locked():
+        return {k: list(v) for k, v in _groups_locked(str(pmid)).items()}
 
-    # Require decisions from distinct reviewers for consensus
-    support_reviewers = set()
-    for l in logs:
-        act = _norm_action(l.get("action"))
-        if act in (Action.ACCEPT.value, Action.MODIFY.value):
-            who = (l.get("creator") or l.get("reviewer") or "").strip().lower()
-            if who:
-                support_reviewers.add(who)
-
-    if len(support_reviewers) >= min_reviewers_for_consensus:
-        if require_exact_content_match:
-            modify_logs = [l for l in logs if _norm_action(l.get("action")) == Action.MODIFY.value]
-            if len(modify_logs) > 1:
-                contents = {
-                    (
-                        l.get("subject"),
-                        l.get("subject_type"),
-                        l.get("predicate"),
-                        l.get("object"),
-                        l.get("object_type"),
-                        bool(l.get("negation", False)),
-                    )
-                    for l in modify_logs
-                }
-                if len(contents) > 1:
-                    return ConsensusResult.CONFLICT
-        return ConsensusResult.CONSENSUS
 
-    # Not enough distinct reviewers yet -> pending
-    return ConsensusResult.PENDING
+def _shared_groups(pmid: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Cached grouping of one PMID without copying (read-only).
 
-# ---------- Public API ------------------------------------------------------
+    The object is replaced whenever that PMID's logs change, so in-package
+    caches (services.arbitration) can key on its identity.
+    """
+    with _logs_locked():
+        return _groups_locked(str(pmid))
 
-@lru_cache(maxsize=128)
-def aggregate_assertions_for_pmid(pmid: str) -> Dict[str, List[Dict[str, Any]]]:
-    """Aggregate logs for a PMID by lifecycle key (ordered algorithm)."""
-    logs = _load_raw_logs()
-    return _group_logs_by_assertion(pmid, logs)
+
+_ARBITRATION_ACTIONS = frozenset((Action.ARBITRATE.value, Action.ARBITRATE_UNDO.value))
+
+
+def get_arbitration_logs(pmid: str, assertion_key: str) -> List[Dict[str, Any]]:
+    """Arbitrate/undo logs of one assertion lifecycle, time-ascending.
+
+    Filtered once per PMID per log snapshot, so history lookups only touch the
+    (few) arbitration records instead of every review log of the group.
+    """
+    pid = str(pmid)
+    with _logs_locked():
+        per_key = _arbitration_cache.get(pid)
+        if per_key is None:
+            per_key = {}
+            for akey, logs in _groups_locked(pid).items():
+                arb = [l for l in logs if _norm_action(l.get("action")) in _ARBITRATION_ACTIONS]
+                if arb:
+                    per_key[akey] = arb
+            _arbitration_cache[pid] = per_key
+        return list(per_key.get(assertion_key, ()))
+
+
+def _copy_summary_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **row,
+        "support_counts": dict(row["support_counts"]),
+        "reviewers": list(row["reviewers"]),
+        "logs": list(row["logs"]),
+    }
 
 
 def get_detailed_assertion_summary(
@@ -280,31 +540,53 @@ def get_detailed_assertion_summary(
       - reviewers
       - logs
       - conflict_reason (if applicable)
+
+    Cached per (pmid, options) for the current log snapshot, so the other
+    public helpers below can share a single pass. Callers get copied rows.
     """
-    agg = aggregate_assertions_for_pmid(pmid)
+    cache_key = (str(pmid), bool(require_exact_content_match), int(min_reviewers_for_consensus))
+    with _logs_locked():
+        cached = _summary_cache.get(cache_key)
+        if cached is None:
+            cached = _summary_cache[cache_key] = _build_assertion_summary(
+                pmid, require_exact_content_match, min_reviewers_for_consensus
+            )
+        return [_copy_summary_row(row) for row in cached]
+
+
+def _build_assertion_summary(
+    pmid: str,
+    require_exact_content_match: bool,
+    min_reviewers_for_consensus: int,
+) -> List[Dict[str, Any]]:
+    agg = _groups_locked(str(pmid))
     summary: List[Dict[str, Any]] = []
     for assertion_key, logs in agg.items():
-        status = consensus_decision(
-            logs,
-            require_exact_content_match=require_exact_content_match,
-            min_reviewers_for_consensus=min_reviewers_for_consensus,
-        )
-        actions = [_norm_action(l.get("action")) for l in logs if l.get("action") is not None]
-        counter = Counter(actions)
-        last = max((_ts(l) for l in logs), default=0.0)
-        reviewers = sorted({
-            (l.get("creator") or l.get("reviewer") or "").lower()
-            for l in logs if (l.get("creator") or l.get("reviewer"))
-        })
+        status, diverged = _decide(logs, require_exact_content_match, min_reviewers_for_consensus)
+        # One pass collects both action counts and distinct reviewers
+        counter: Dict[str, int] = {}
+        seen_reviewers = set()
+        for l in logs:
+            get = l.get
+            act = get("action")
+            if act is not None:
+                act = _norm_action(act)
+                counter[act] = counter.get(act, 0) + 1
+            who = get("creator") or get("reviewer")
+            if who:
+                seen_reviewers.add(who.lower())
+        # Groups are time-ascending (see _group_logs_for_pmid_ordered)
+        last = _ts(logs[-1]) if logs else 0.0
+        reviewers = sorted(seen_reviewers)
         item: Dict[str, Any] = {
             "assertion_key": assertion_key,
             "consensus_status": status.value,
-            "support_counts": dict(counter),
+            "support_counts": counter,
             "last_updated": last,
             "reviewers": reviewers,
-            "logs": sorted(logs, key=_ts),
+            "logs": logs,
             # Mark groups that only contain "add" actions so callers can exclude them from status charts
-            "is_add_only": bool(counter) and set(counter.keys()).issubset({Action.ADD.value}),
+            "is_add_only": bool(counter) and counter.keys() <= {Action.ADD.value},
         }
         if status == ConsensusResult.CONFLICT:
             reasons = []
@@ -313,19 +595,9 @@ def get_detailed_assertion_summary(
             if counter.get(Action.UNCERTAIN.value, 0) > 0:
                 reasons.append("contains uncertain")
             if counter.get(Action.MODIFY.value, 0) > 1 and require_exact_content_match:
-                modify_logs = [l for l in logs if _norm_action(l.get("action")) == Action.MODIFY.value]
-                contents = {
-                    (
-                        l.get("subject"),
-                        l.get("subject_type"),
-                        l.get("predicate"),
-                        l.get("object"),
-                        l.get("object_type"),
-                        bool(l.get("negation", False)),
-                    )
-                    for l in modify_logs
-                }
-                if len(contents) > 1:
+                if diverged is None:
+                    diverged = _modify_contents_diverge(logs)
+                if diverged:
                     reasons.append("modify content mismatch")
             item["conflict_reason"] = "; ".join(reasons) if reasons else "mixed signals"
         summary.append(item)
@@ -345,6 +617,11 @@ def _pmids_from_logs(logs: Iterable[Dict[str, Any]]) -> List[str]:
     return out
 
 
+def get_logged_pmids() -> List[str]:
+    """Distinct PMIDs present in the cached log snapshot (first-seen order)."""
+    return _pmids_from_logs(_load_raw_logs())
+
+
 def find_assertion_conflicts(pmid: Optional[str] = None) -> List[Dict[str, Any]]:
     """List current conflicted assertions (excluding arbitrated).
     - If pmid specified: check only that pmid
@@ -354,21 +631,17 @@ def find_assertion_conflicts(pmid: Optional[str] = None) -> List[Dict[str, Any]]
     if pmid is not None:
         targets = [str(pmid)]
     else:
-        pmids_abs = list(get_all_pmids())
-        pmids_logs = _pmids_from_logs(raw)
-        targets = list({*pmids_abs, *pmids_logs})
+        targets = list({*iter_pmids(), *_pmids_from_logs(raw)})
 
     conflicts: List[Dict[str, Any]] = []
     for pid in targets:
-        agg = _group_logs_for_pmid_ordered(pid, raw)
-        for key, logs in agg.items():
-            status = consensus_decision(logs)
-            if status == ConsensusResult.CONFLICT:
+        for item in get_detailed_assertion_summary(pid):
+            if item["consensus_status"] == ConsensusResult.CONFLICT.value:
                 conflicts.append({
                     "pmid": pid,
-                    "assertion_key": key,
-                    "logs": sorted(logs, key=_ts),
-                    "status": status.value,
+                    "assertion_key": item["assertion_key"],
+                    "logs": item["logs"],
+                    "status": item["consensus_status"],
                 })
     return conflicts
 
@@ -464,7 +737,7 @@ def export_final_consensus(out_path: Optional[str | Path] = None) -> tuple[int,
     raw = _load_raw_logs()
     # Authority is DB; union with logs for completeness
     try:
-        pmids = list({*get_all_pmids(), *_pmids_from_logs(raw)})
+        pmids = list({*iter_pmids(), *_pmids_from_logs(raw)})
     except Exception:
         pmids = _pmids_from_logs(raw)
 
@@ -488,33 +761,53 @@ def export_summary_to_json(pmid: str, out_path: str) -> bool:
     """Export a detailed assertion summary for a PMID to a JSON file."""
     try:
         summary = get_detailed_assertion_summary(pmid)
-        Path(os.path.dirname(out_path) or ".").mkdir(parents=True, exist_ok=True)
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            with open(out_path, "wb") as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(out_path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
         return True
     except Exception:
         logger.exception("Failed to export summary for %s -> %s", pmid, out_path)
         return False
 
 
+def _conflict_count(pid: str) -> int:
+    """Number of CONFLICT groups of one PMID, cached until its logs change."""
+    with _logs_locked():
+        cnt = _conflict_count_cache.get(pid)
+        if cnt is None:
+            agg = _groups_locked(pid)  # 复用缓存友好的聚合
+            cnt = sum(1 for ls in agg.values() if consensus_decision(ls) == ConsensusResult.CONFLICT)
+            _conflict_count_cache[pid] = cnt
+        return cnt
+
+
 def get_conflict_overview() -> Dict[str, Any]:
     """Summarize conflict overview: total PMIDs, conflicts per PMID, and total conflicts.
     PMIDs come from the union of abstracts and logs.
     """
-    raw = _load_raw_logs()
-    pmids = list({*get_all_pmids(), *_pmids_from_logs(raw)})
-
-    over: Dict[str, Any] = {
-        "total_pmids": len(pmids),
-        "conflicts": 0,
-        "per_pmid": {},
-        "generated_at": int(_get_log_file_mtime()),
-    }
+    with _logs_locked():
+        raw = _cached_parsed_logs or []
+        by_pmid = _cached_by_pmid or {}
+        mtime = _cached_log_stat[3] if _cached_log_stat else 0.0
+    per_pmid: Dict[str, int] = dict.fromkeys({*iter_pmids(), *_pmids_from_logs(raw)}, 0)
+
+    # Only PMIDs with logs can hold conflicts: a single pass over the pmid index,
+    # recomputing only PMIDs whose logs changed since the last overview
     total_conflicts = 0
-    for pid in pmids:
-        agg = aggregate_assertions_for_pmid(pid)  # 复用缓存友好的聚合
-        cnt = sum(1 for ls in agg.values() if consensus_decision(ls) == ConsensusResult.CONFLICT)
-        over["per_pmid"][pid] = cnt
+    for pid in by_pmid:
+        if pid not in per_pmid:
+            continue
+        cnt = _conflict_count(pid)
+        per_pmid[pid] = cnt
         total_conflicts += cnt
-    over["conflicts"] = total_conflicts
-    return over
\ No newline at end of file
+
+    return {
+        "total_pmids": len(per_pmid),
+        "conflicts": total_conflicts,
+        "per_pmid": per_pmid,
+        "generated_at": int(mtime),
+    }
@@ -1,22 +1,29 @@
 # backend/services/arbitration.py
 from __future__ import annotations
 
+import heapq
+import threading
 import time
-from typing import List, Optional, Dict, Any, Literal, Iterable
-from collections import Counter
+from typing import List, Optional, Dict, Any, Literal
 
-from ..models.abstracts import get_all_pmids
-from ..models.logs import log_review_action, load_logs
+from ..models.abstracts import iter_pmids
+from ..models.logs import log_review_action
 from ..services.aggregation import (
-    find_assertion_conflicts,
+    _shared_groups,
     aggregate_assertions_for_pmid,
     consensus_decision,
+    get_arbitration_logs,
+    get_logged_pmids,
     ConsensusResult,
-    invalidate_cache,
 )
 
 ArbitrateDecision = Literal["accept", "modify", "reject", "uncertain"]
 
+_ALLOWED_DECISIONS = frozenset(("accept", "modify", "reject", "uncertain"))
+# Status strings as stored on queue rows (compared per item when filtering)
+_CONFLICT_V = ConsensusResult.CONFLICT.value
+_WAITING_V = frozenset((ConsensusResult.PENDING.value, ConsensusResult.UNCERTAIN.value))
+
 
 class ArbitrationError(Exception):
     """Custom error for arbitration-related invalid operations."""
@@ -43,16 +50,72 @@ def _ts(log: Dict[str, Any]) -> float:
             continue
     return 0.0
 
-def _pmids_from_logs(raw: Iterable[Dict[str, Any]]) -> List[str]:
-    """Collect distinct PMIDs found in raw logs."""
-    seen, out = set(), []
-    for l in raw:
-        pid = str(l.get("pmid") or "").strip()
-        if not pid or pid in seen:
+def _last_updated_key(item: Dict[str, Any]) -> float:
+    return item.get("last_updated", 0.0)
+
+
+# ----------------------------- queue rows cache ------------------------------
+
+# pmid -> (groups dict the rows were built from, rows). aggregate_assertions_for_pmid
+# returns the same dict object until that PMID's logs change, so identity acts as
+# the version check.
+_queue_rows_cache: Dict[str, Any] = {}
+_queue_rows_lock = threading.Lock()
+
+
+def _build_queue_rows(pid: str, groups: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for akey, logs in groups.items():
+        # 跳过已仲裁（出现 arbitrate）
+        if any(_norm_action(l.get("action")) == "arbitrate" for l in logs):
             continue
-        seen.add(pid)
-        out.append(pid)
-    return out
+
+        status = consensus_decision(logs)
+
+        # 忽略仅包含 add 的生命周期（尚未开始评审，不应进入仲裁）
+        counts: Dict[str, int] = {}
+        for l in logs:
+            if l.get("action"):
+                act = _norm_action(l.get("action"))
+                counts[act] = counts.get(act, 0) + 1
+        if counts and counts.keys() <= {"add"}:
+            continue
+
+        # 简单冲突原因（可选）
+        conflict_reason = None
+        if status == ConsensusResult.CONFLICT:
+            bits = []
+            if counts.get("reject", 0) > 0:
+                bits.append("contains reject")
+            if counts.get("uncertain", 0) > 0:
+                bits.append("contains uncertain")
+            conflict_reason = "; ".join(bits) if bits else "mixed signals"
+
+        # 分组日志已按时间升序
+        rows.append({
+            "pmid": pid,
+            "assertion_key": akey,
+            "assertion_id": akey,   # 兼容旧字段名
+            "logs": logs,
+            "status": status.value,
+            "support_counts": counts,
+            "conflict_reason": conflict_reason,
+            "last_updated": _ts(logs[-1]) if logs else 0.0,
+        })
+    return rows
+
+
+def _queue_rows_for_pmid(pid: str) -> List[Dict[str, Any]]:
+    """Candidate queue rows of one PMID, rebuilt only when its aggregation changes."""
+    groups = _shared_groups(pid)  # {assertion_key: logs}；快照变化时换成新对象
+    with _queue_rows_lock:
+        hit = _queue_rows_cache.get(pid)
+        if hit is not None and hit[0] is groups:
+            return hit[1]
+    rows = _build_queue_rows(pid, groups)
+    with _queue_rows_lock:
+        _queue_rows_cache[pid] = (groups, rows)
+    return rows
 
 
 # ----------------------------- public API ------------------------------------
@@ -80,81 +143,59 @@ def get_arbitration_queue(
     if pmid is not None:
         targets = [str(pmid)]
     else:
-        raw_logs = load_logs()
-        pmids_logs = _pmids_from_logs(raw_logs)
-        pmids_abs = list(get_all_pmids())
-        targets = list({*pmids_logs, *pmids_abs})
+        # 复用聚合层缓存的日志快照（不再整份重读）；dict.fromkeys 去重且顺序稳定
+        targets = list(dict.fromkeys([*get_logged_pmids(), *iter_pmids()]))
 
     for pid in targets:
-        groups = aggregate_assertions_for_pmid(pid)  # {assertion_key: logs}
-        for akey, logs in groups.items():
-            # 跳过已仲裁（出现 arbitrate）
-            if any(_norm_action(l.get("action")) == "arbitrate" for l in logs):
-                continue
-
-            status = consensus_decision(logs)
-
-            # 忽略仅包含 add 的生命周期（尚未开始评审，不应进入仲裁）
-            actions = [_norm_action(l.get("action")) for l in logs if l.get("action")]
-            counts = dict(Counter(actions))
-            if counts and set(counts.keys()).issubset({"add"}):
-                continue
-
+        for row in _queue_rows_for_pmid(pid):
+            status = row["status"]
             if only_conflicts:
-                if status != ConsensusResult.CONFLICT:
+                if status != _CONFLICT_V:
                     # 可选择把未决/不确定也塞入
-                    if include_pending and status in (ConsensusResult.PENDING, ConsensusResult.UNCERTAIN):
+                    if include_pending and status in _WAITING_V:
                         pass
                     else:
                         continue
             else:
-                if not include_pending and status in (ConsensusResult.PENDING, ConsensusResult.UNCERTAIN):
+                if not include_pending and status in _WAITING_V:
                     continue
-
-            # 统计 & 排序日志
-            # actions/counts 已在上面计算
-            logs_sorted = sorted(logs, key=_ts)
-
-            # 简单冲突原因（可选）
-            conflict_reason = None
-            if status == ConsensusResult.CONFLICT:
-                bits = []
-                if counts.get("reject", 0) > 0:
-                    bits.append("contains reject")
-                if counts.get("uncertain", 0) > 0:
-                    bits.append("contains uncertain")
-                conflict_reason = "; ".join(bits) if bits else "mixed signals"
-
-            queue.append({
-                "pmid": pid,
-                "assertion_key": akey,
-                "assertion_id": akey,   # 兼容旧字段名
-                "logs": logs_sorted,
-                "status": status.value,
-                "support_counts": counts,
-                "conflict_reason": conflict_reason,
-                "last_updated": _ts(logs_sorted[-1]) if logs_sorted else 0.0,
-            })
+            queue.append({**row, "logs": list(row["logs"]), "support_counts": dict(row["support_counts"])})
 
     # 排序：最近更新时间倒序；同时间可以保留原相对顺序
-    queue.sort(key=lambda it: it.get("last_updated", 0.0), reverse=True)
-
+    # last_updated 在构建行时已算好，排序键只做一次取值
     if limit:
-        queue = queue[: int(limit)]
+        # 等价于 sorted(..., reverse=True)[:limit]，但只维护 limit 大小的堆
+        return heapq.nlargest(int(limit), queue, key=_last_updated_key)
+    queue.sort(key=_last_updated_key, reverse=True)
     return queue
 
 
-def get_latest_arbitration(assertion_key: str, pmid: str) -> Optional[Dict[str, Any]]:
+def get_latest_arbitration(
+    assertion_key: str,
+    pmid: str,
+    groups: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> Optional[Dict[str, Any]]:
     """
     Retrieve the most recent arbitration entry (action == 'arbitrate')
     for a given assertion lifecycle (assertion_key).
+    Callers that already aggregated the PMID can pass `groups` to skip re-aggregation.
     """
-    groups = aggregate_assertions_for_pmid(pmid)
-    logs = groups.get(assertion_key, []) or []
-    arb_logs = [l for l in logs if _norm_action(l.get("action")) == "arbitrate"]
-    if not arb_logs:
-        return None
-    return max(arb_logs, key=_ts)
+    if groups is None:
+        logs = get_arbitration_logs(pmid, assertion_key)  # arbitrate/undo only
+    else:
+        logs = groups.get(assertion_key, []) or []
+    # Groups are time-ascending: scan from the end and stop once timestamps drop
+    # below the newest arbitrate (ties resolve to the earliest, as max() did).
+    latest: Optional[Dict[str, Any]] = None
+    latest_ts = 0.0
+    for l in reversed(logs):
+        if latest is not None and _ts(l) < latest_ts:
+            break
+        if _norm_action(l.get("action")) == "arbitrate":
+            t = _ts(l)
+            if latest is None or t >= latest_ts:
+                latest, latest_ts = l, t
+    return latest
 
 
 def set_arbitration_result(
@@ -172,29 +213,28 @@ def set_arbitration_result(
     - 写入后会自动失效聚合缓存。
     """
     normalized = _norm_action(decision)
-    if normalized not in {"accept", "modify", "reject", "uncertain"}:
+    if normalized not in _ALLOWED_DECISIONS:
         raise ArbitrationError(f"Unsupported arbitration decision: {decision}")
 
     # Append-only policy: no destructive overwrite. If not overwrite, require conflict membership;
     # if the same decision exists already, return latest.
-    if not overwrite:
-        conflicts = find_assertion_conflicts(pmid)  # 仅扫描该 pmid（配合我们上游聚合，日志也能识别）
-        conflict_keys = {c["assertion_key"] for c in conflicts}
-        if assertion_key not in conflict_keys:
-            latest = get_latest_arbitration(assertion_key, pmid)
-            if latest and _norm_action(latest.get("arbitrate_decision")) == normalized:
-                return latest
-            raise ArbitrationError(
-                f"Assertion {assertion_key} for PMID {pmid} is not in conflict and overwrite is False."
-            )
-
-    # 取仲裁前的共识状态（用于审计，失败不阻断）
+    # 一次聚合同时得出：冲突归属、最近仲裁、仲裁前共识状态
+    # （与 find_assertion_conflicts(pmid) 的判定一致：默认参数下该分组为 CONFLICT）
+    groups = aggregate_assertions_for_pmid(pmid)
+    prior_logs = groups.get(assertion_key, [])
     try:
-        groups = aggregate_assertions_for_pmid(pmid)
-        prior_logs = groups.get(assertion_key, [])
-        prior_status = consensus_decision(prior_logs).value if prior_logs else ConsensusResult.PENDING.value
+        prior = consensus_decision(prior_logs) if prior_logs else ConsensusResult.PENDING
+        prior_status = prior.value
     except Exception:
-        prior_status = "unknown"
+        prior, prior_status = None, "unknown"  # 用于审计，失败不阻断
+
+    if not overwrite and prior != ConsensusResult.CONFLICT:
+        latest = get_latest_arbitration(assertion_key, pmid, groups=groups)
+        if latest and _norm_action(latest.get("arbitrate_decision")) == normalized:
+            return latest
+        raise ArbitrationError(
+            f"Assertion {assertion_key} for PMID {pmid} is not in conflict and overwrite is False."
+        )
 
     record: Dict[str, Any] = {
         "action": "arbitrate",
@@ -209,8 +249,8 @@ def set_arbitration_result(
         # traceability fields will be backfilled in logs module if request context exists
     }
 
+    # log_review_action 已做追加式失效：文件快照增量读取新记录，无需整体重载
     log_review_action(record)
-    invalidate_cache()  # 立刻刷新聚合缓存
     return record
 
 
@@ -233,7 +273,6 @@ def undo_arbitration(assertion_key: str, pmid: str, admin_email: str, reason: st
         "created_at": time.time(),
     }
     log_review_action(record)
-    invalidate_cache()
     return record
 
 
@@ -241,8 +280,5 @@ def get_arbitration_history(assertion_key: str, pmid: str) -> List[Dict[str, Any
     """
     Return full sequence of arbitration-related records (arbitrate + undo) for an assertion lifecycle.
     """
-    groups = aggregate_assertions_for_pmid(pmid)
-    logs = groups.get(assertion_key, []) or []
-    history = [l for l in logs if _norm_action(l.get("action")) in ("arbitrate", "arbitrate_undo")]
-    history.sort(key=_ts)
-    return history
\ No newline at end of file
+    # Pre-filtered once per PMID in the aggregation cache (time-ascending)
+    return list(get_arbitration_logs(pmid, assertion_key))
@@ -283,7 +283,7 @@ def assign_abstract_to_reviewer(
         empties: List[str] = []  # no lock yet
         partials: List[str] = [] # has reviewers but capacity available (not including this email)
 
-        for abstract in load_abstracts():
+        for abstract in load_abstracts(fields=("pmid",)):
             pmid = str(abstract.get("pmid") or "")
             if not pmid:
                 continue
@@ -355,7 +355,7 @@ def assign_abstract_to_reviewer(
                 return pmid
 
         # Fallback: still respect historical reviewer rule and db lock
-        for abstract in load_abstracts():
+        for abstract in load_abstracts(fields=("pmid",)):
             pmid = str(abstract.get("pmid") or "")
             if not pmid:
                 continue
@@ -3,7 +3,7 @@ import json
 import time
 import hashlib
 from pathlib import Path
-from backend.models.db import abstracts_col
+from backend.models.abstracts import iter_abstracts
 from backend.models.logs import log_review_action
 
 def export_passed_assertions(export_path):
@@ -16,7 +16,7 @@ def export_passed_assertions(export_path):
 
     total = 0
     with open(out_path, 'w', encoding='utf-8') as f:
-        for abs_doc in abstracts_col.find({}):
+        for abs_doc in iter_abstracts(fields=("pmid", "sentences")):
             pmid = abs_doc['pmid']
             for s in abs_doc.get('sentences', []):
                 sent_idx = s['sentence_index']
@@ -6,7 +6,13 @@ import threading
 import time
 import uuid
 from typing import Callable, Optional, Dict, Any
-from backend.models.db import abstracts_col
+try:  # orjson 解析更快；缺失时回退标准库（二者都接受 bytes）
+    import orjson as _orjson
+    _loads = _orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+from backend.models.db import abstracts_col, ensure_indexes_ready
+from backend.models.abstracts import invalidate_cache as _invalidate_abstracts
 from backend.schemas.abstracts import Abstract
 from backend.models.logs import log_review_action
 from backend.models.logs import log_review_action
@@ -54,7 +60,11 @@ def load_jsonl_to_db(jsonl_path, error_log_path="data/failed_imports.jsonl", bat
     total = 0
     success = 0
     started_at = time.time()
-    with open(jsonl_path, 'r', encoding='utf-8') as f, \
+    changed = False
+    # 逐行按 pmid find_one：先等启动时的后台建索引完成（pmid_unique），避免批量导入走全表扫描
+    ensure_indexes_ready(timeout=30)
+    # 以二进制逐行读取（仍是流式，内存有界），直接把 bytes 交给解析器，省掉文本解码层
+    with open(jsonl_path, 'rb') as f, \
          open(error_log_path, 'a', encoding='utf-8') as errf:
         for line in f:
             total += 1
@@ -62,7 +72,7 @@ def load_jsonl_to_db(jsonl_path, error_log_path="data/failed_imports.jsonl", bat
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = _loads(line)
                 obj = fill_assertion_index(obj)
                 abstract = Abstract.model_validate(obj)
                 pmid = abstract.pmid
@@ -70,17 +80,19 @@ def load_jsonl_to_db(jsonl_path, error_log_path="data/failed_imports.jsonl", bat
                 doc_new = abstract.model_dump()
                 if not doc:
                     abstracts_col.insert_one(doc_new)
+                    changed = True
                 else:
                     updated = merge_abstract(doc, doc_new)
                     if updated:
                         abstracts_col.replace_one({"pmid": pmid}, doc)
+                        changed = True
                 success += 1
             except Exception as e:
                 failed += 1
                 errf.write(json.dumps({
                     "error": str(e),
                     "traceback": traceback.format_exc(),
-                    "raw": line
+                    "raw": line.decode("utf-8", "replace")
                 }, ensure_ascii=False) + "\n")
                 errf.flush()
                 try:
@@ -102,6 +114,9 @@ def load_jsonl_to_db(jsonl_path, error_log_path="data/failed_imports.jsonl", bat
                         "started_at": started_at,
                         "updated_at": time.time(),
                     })
+    if changed:
+        # 新增与替换都让摘要缓存（含 pmid 快照）立即失效；整批只失效一次
+        _invalidate_abstracts()
     print(f"\nImport complete: Total {total} items, successful {success} items, failed {failed} items. Failed samples logged to {error_log_path}.")
     if progress_callback:
         progress_callback({
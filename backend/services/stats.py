@@ -13,7 +13,6 @@ from ..config import get_default_pricing_descriptor as _pricing_from_cfg
 from ..models.abstracts import get_abstract_by_id
 from ..models import abstracts as abstracts_model
 from ..services.aggregation import get_detailed_assertion_summary
-from typing import List
 
 
 def get_stats_for_reviewer(email: str) -> Dict[str, Any]:
@@ -50,12 +49,15 @@ def compute_platform_analytics(reviewer_email: str | None = None) -> Dict[str, A
       summarize their contributions.
     """
     # 1) Abstract-level totals from Mongo/file via models
-    abstracts = abstracts_model.load_abstracts()
+    # 只投影出断言数组（不取句子文本/标题等大字段），两种存储形态都覆盖
+    abstracts = abstracts_model.load_abstracts(fields=("sentences.assertions", "sentence_results.assertions"))
     total_abstracts = len(abstracts)
     total_sentences = 0
     total_assertions = 0
     for a in abstracts:
-        sents = a.get("sentence_results", []) or []
+        sents = a.get("sentences")
+        if not isinstance(sents, list):
+            sents = a.get("sentence_results", []) or []
         total_sentences += len(sents)
         for s in sents:
             total_assertions += len(s.get("assertions", []) or [])
@@ -64,10 +66,10 @@ def compute_platform_analytics(reviewer_email: str | None = None) -> Dict[str, A
     status_counts = {"consensus": 0, "conflict": 0, "uncertain": 0, "pending": 0, "arbitrated": 0}
     status_abstracts: Dict[str, set] = {k: set() for k in status_counts.keys()}
     try:
-        from ..models.abstracts import get_all_pmids
-        pmids: List[str] = list(get_all_pmids())
+        from ..models.abstracts import iter_pmids
+        pmids = iter_pmids()
     except Exception:
-        pmids = []
+        pmids = ()
     for pid in pmids:
         try:
             detailed = get_detailed_assertion_summary(pid)
@@ -15,20 +15,22 @@ Single source of truth for vocabularies (predicates & entity types).
 
 # ---- Canonical lists -------------------------------------------------------
 
-_PREDICATES: List[str] = [
+# 不可变 tuple 常量：编译期折叠进 co_consts，导入时不再逐个构建列表
+_PREDICATES: Tuple[str, ...] = (
     "PREDISPOSES","COEXISTS_WITH","TREATS","AFFECTS","ISA","PROCESS_OF","USES",
     "ASSOCIATED_WITH","CAUSES","DIAGNOSES","MANIFESTATION_OF","LOCATION_OF","PRECEDES",
     "PART_OF","PREVENTS","DISRUPTS","COMPLICATES","ADMINISTERED_TO","PRODUCES",
     "INTERACTS_WITH","OCCURS_IN","COMPARED_WITH","AUGMENTS","STIMULATES","SAME_AS",
-    "METHOD_OF","MEASUREMENT_OF","INHIBITS","CONVERTS_TO"
-]
+    "METHOD_OF","MEASUREMENT_OF","INHIBITS","CONVERTS_TO",
+)
 
-_ENTITY_TYPES: List[str] = [
-    "acab","anab","cgab","dsyn","emod","fndg","inpo","mobd","neop","orga","patf","phsu","sosy"
-]
+_ENTITY_TYPES: Tuple[str, ...] = (
+    "acab","anab","cgab","dsyn","emod","fndg","inpo","mobd","neop","orga","patf","phsu","sosy",
+)
 
-_PREDICATE_SET = set(_PREDICATES)          # UPPERCASE
-_ENTITY_TYPE_SET = set(_ENTITY_TYPES)      # lowercase
+_PREDICATE_SET = frozenset(_PREDICATES)         # UPPERCASE
+_ENTITY_TYPE_SET = frozenset(_ENTITY_TYPES)     # lowercase
+_PREDICATES_LOWER: Tuple[str, ...] = tuple(p.lower() for p in _PREDICATES)  # get_whitelists 旧接口用
 
 # ---- Descriptions (optional) ----------------------------------------------
 
@@ -110,7 +112,7 @@ def get_whitelists(*, predicates_lowercase: bool = True) -> Tuple[List[str], Lis
     - By default, predicates are LOWERCASED for legacy callers that expect lowercase.
     - Entity types are lowercase (canonical).
     """
-    preds = [p.lower() for p in _PREDICATES] if predicates_lowercase else list(_PREDICATES)
+    preds = list(_PREDICATES_LOWER) if predicates_lowercase else list(_PREDICATES)
     ents = list(_ENTITY_TYPES)
     return preds, ents
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 # ==== Email / identity helpers ============================================
@@ -43,6 +44,13 @@ def _domain_matches(domain: str, allowed: Union[str, Iterable[str]]) -> bool:
     return _match_one(str(allowed))
 
 
+@lru_cache(maxsize=64)
+def _clean_domains(domains: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercase/strip an allowed-domain tuple once; falls back to the default domain."""
+    cleaned = tuple(str(d or "").strip().lower() for d in domains if str(d or "").strip())
+    return cleaned or (DEFAULT_EMAIL_DOMAIN,)
+
+
 def normalize_email(raw: Any) -> str:
     """Normalize email lowercasing and whitespace; invalid input returns empty string."""
     if not isinstance(raw, str):
@@ -50,6 +58,10 @@ def normalize_email(raw: Any) -> str:
     return raw.strip().lower()
 
 
+# RFC 5321 path limit; also caps regex work on hostile input
+_MAX_EMAIL_LEN = 254
+
+
 def is_valid_email(
     email: Any,
     *,
@@ -64,6 +76,19 @@ def is_valid_email(
     if not isinstance(email, str):
         return False
     email = email.strip().lower()
+    if len(email) > _MAX_EMAIL_LEN:
+        return False
+    domains = tuple(allowed_domains)
+    try:
+        return _check_email(email, restrict_domain, domains, allow_suffix_match)
+    except TypeError:
+        # 非可哈希的域配置：走未缓存路径
+        return _check_email.__wrapped__(email, restrict_domain, domains, allow_suffix_match)
+
+
+@lru_cache(maxsize=4096)
+def _check_email(email: str, restrict_domain: bool, allowed_domains: Tuple[str, ...], allow_suffix_match: bool) -> bool:
+    """Memoized core of is_valid_email (inputs are normalized and length-capped)."""
     if not _EMAIL_RE.match(email):
         return False
 
@@ -83,9 +108,7 @@ def is_valid_email(
     except Exception:
         pass
 
-    allowed_clean = [str(d or "").strip().lower() for d in allowed_domains if str(d or "").strip()]
-    if not allowed_clean:
-        allowed_clean = [DEFAULT_EMAIL_DOMAIN]
+    allowed_clean = _clean_domains(allowed_domains)
 
     if allow_suffix_match:
         return any(_domain_matches(domain, a) for a in allowed_clean)
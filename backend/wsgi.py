@@ -1,3 +1,5 @@
 # backend/wsgi.py
+# Production entry: gunicorn -w $(nproc) -k gthread --threads 4 backend.wsgi:application
+# 每个 worker 进程各自持有日志/聚合缓存与锁，缓存按文件 stat 校验，跨进程保持一致。
 from backend.app import create_app
-app = create_app()
\ No newline at end of file
+application = app = create_app()
@@ -136,4 +136,4 @@ def login_admin(client):
 
 @pytest.fixture()
 def logs_path(monkeypatch):
-    return Path(os.environ["MANUAL_REVIEW_REVIEW_LOGS_PATH"])
\ No newline at end of file
+    return Path(os.environ["MANUAL_REVIEW_REVIEW_LOGS_PATH"])
@@ -0,0 +1,179 @@
+import sys
+
+import backend.models.abstracts as abs_model
+
+
+class _FakeCol:
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = 0
+
+    def find_one(self, q, projection=None):
+        self.calls += 1
+        d = self.docs.get(q.get("pmid"))
+        return dict(d) if d else None
+
+
+def test_get_abstract_by_id_caches_hits(monkeypatch):
+    col = _FakeCol({"42": {"pmid": "42", "sentence_results": []}})
+    monkeypatch.setattr(abs_model, "abstracts_col", col)
+    abs_model.invalidate_cache()
+
+    a = abs_model.get_abstract_by_id(42)
+    a["title"] = "mutated"  # 调用方修改不能污染缓存
+    b = abs_model.get_abstract_by_id("42")
+    assert col.calls == 1
+    assert "title" not in b
+
+    # 未命中不缓存；invalidate 后重新读取
+    assert abs_model.get_abstract_by_id("404") is None
+    assert abs_model.get_abstract_by_id("404") is None
+    assert col.calls == 3
+    abs_model.invalidate_cache()
+    abs_model.get_abstract_by_id("42")
+    assert col.calls == 4
+
+
+def test_get_all_pmids_debounced(monkeypatch):
+    calls = []
+
+    class _Col:
+        def find(self, q, proj, **kw):
+            calls.append(1)
+            return [{"pmid": 1}, {"pmid": "2"}, {}]
+
+    monkeypatch.setattr(abs_model, "abstracts_col", _Col())
+    abs_model.invalidate_cache()
+    first = abs_model.get_all_pmids()
+    first.append("x")  # 返回的是新列表，修改不影响缓存
+    assert abs_model.get_all_pmids() == ["1", "2"]
+    assert len(calls) == 1
+    # 写入后失效
+    abs_model.invalidate_cache()
+    abs_model.get_all_pmids()
+    assert len(calls) == 2
+
+
+def test_normalize_interns_vocab_fields():
+    doc = {"pmid": "1", "sentences": [
+        {"sentence_index": 1, "sentence": "s", "assertions": [
+            {"predicate": "".join(["TRE", "ATS"]), "subject_type": "".join(["ds", "yn"]), "object_type": None},
+        ]},
+    ]}
+    out = abs_model._normalize_abstract(doc)
+    asr = out["sentence_results"][0]["assertions"][0]
+    # 拼接出来的新字符串被 intern 成同一对象；非字符串保持原样
+    assert asr["predicate"] is sys.intern("TREATS")
+    assert asr["subject_type"] is sys.intern("dsyn")
+    assert asr["object_type"] is None
+
+
+def test_normalize_copies_sentences_and_strips_nested_ids():
+    doc = {"_id": 1, "pmid": "1", "sentences": [
+        {"_id": 2, "sentence": "a", "assertions": [{"_id": 3, "predicate": "TREATS"}]},
+        {"sentence_index": 9, "assertions": None},
+    ]}
+    out = abs_model._normalize_abstract(doc)
+    srs = out["sentence_results"]
+    # sentence_results 是逐句副本：改它不会影响 sentences
+    srs[0]["sentence"] = "edited"
+    assert doc["sentences"][0]["sentence"] == "a" and "sentence_index" not in doc["sentences"][0]
+    assert srs[0]["sentence_index"] == 1 and srs[1]["sentence_index"] == 9
+    assert srs[1]["sentence"] == "" and srs[1]["assertions"] == []
+    assert "_id" not in out and "_id" not in srs[0] and "_id" not in srs[0]["assertions"][0]
+    assert out["sentence_count"] == 2
+
+
+def test_load_abstracts_pmid_only_uses_snapshot(monkeypatch):
+    calls = []
+
+    class _Col:
+        def find(self, q, proj=None, **kw):
+            calls.append(proj)
+            return [{"pmid": 5}, {"pmid": "6"}]
+
+    monkeypatch.setattr(abs_model, "abstracts_col", _Col())
+    abs_model.invalidate_cache()
+    assert abs_model.load_abstracts(fields=("pmid",)) == [{"pmid": "5"}, {"pmid": "6"}]
+    assert abs_model.get_all_pmids() == ["5", "6"]
+    assert len(calls) == 1  # 两个入口共享同一份快照
+
+
+def test_iter_pmids_returns_shared_tuple(monkeypatch):
+    class _Col:
+        def find(self, q, proj=None, **kw):
+            return [{"pmid": "7"}]
+
+    monkeypatch.setattr(abs_model, "abstracts_col", _Col())
+    abs_model.invalidate_cache()
+    a = abs_model.iter_pmids()
+    assert a == ("7",) and abs_model.iter_pmids() is a  # 只读视图，不复制
+    assert abs_model.get_all_pmids() is not abs_model.get_all_pmids()
+
+
+def test_pmid_snapshot_single_flight(monkeypatch):
+    import threading
+    import time as _t
+    calls = []
+
+    class _SlowCol:
+        def find(self, q, proj=None, **kw):
+            calls.append(1)
+            _t.sleep(0.05)
+            return [{"pmid": "1"}]
+
+    monkeypatch.setattr(abs_model, "abstracts_col", _SlowCol())
+    abs_model.invalidate_cache()
+    out = []
+    threads = [threading.Thread(target=lambda: out.append(abs_model.iter_pmids())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 8 个并发读者只触发一次扫表
+    assert len(calls) == 1 and out == [("1",)] * 8
+
+
+def test_pmid_scan_hints_index_and_falls_back(monkeypatch):
+    seen = []
+
+    class _Col:
+        def find(self, q, proj=None, **kw):
+            seen.append(kw.get("hint"))
+            if kw.get("hint"):
+                raise RuntimeError("bad hint")  # 模拟索引尚未建好
+            return [{"pmid": "1"}, {"pmid": 2}, {"pmid": None}]
+
+    monkeypatch.setattr(abs_model, "abstracts_col", _Col())
+    abs_model.invalidate_cache()
+    assert abs_model.get_all_pmids() == ["1", "2"]
+    assert seen == ["pmid_unique", None]
+
+
+def test_iter_abstracts_paginates_by_id(monkeypatch):
+    docs = [{"_id": i, "pmid": str(i)} for i in range(1, 6)]
+    queries = []
+
+    class _Cur:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def sort(self, key, direction):
+            self.rows = sorted(self.rows, key=lambda d: d[key])
+            return self
+
+        def limit(self, n):
+            return iter(self.rows[:n])
+
+    class _Col:
+        def find(self, q, proj=None, **kw):
+            queries.append(q)
+            gt = q.get("_id", {}).get("$gt", 0)
+            return _Cur([dict(d) for d in docs if d["_id"] > gt])
+
+    monkeypatch.setattr(abs_model, "abstracts_col", _Col())
+    out = list(abs_model.iter_abstracts(batch=2))
+    # 按 _id 区间翻页，不用 skip；结果不带 _id
+    assert [d["pmid"] for d in out] == ["1", "2", "3", "4", "5"]
+    assert all("_id" not in d for d in out)
+    assert queries == [{}, {"_id": {"$gt": 2}}, {"_id": {"$gt": 4}}]
@@ -0,0 +1,76 @@
+# tests/backend/test_aggregation_incremental_tail.py
+import json
+import time
+from backend.models.logs import log_review_action
+from backend.services import aggregation as agg
+
+def test_appended_logs_are_tailed_not_reparsed(monkeypatch, tmp_path):
+    p = tmp_path / "logs.jsonl"
+    monkeypatch.setenv("MANUAL_REVIEW_REVIEW_LOGS_PATH", str(p))
+    agg.invalidate_cache()
+    now = time.time()
+    log_review_action({"pmid": "501", "action": "add", "subject": "A", "predicate": "TREATS", "object": "B", "created_at": now}, path=p)
+    first = agg._load_raw_logs()
+    if agg._cached_log_offset is None:
+        return  # Mongo 快照：不走增量路径
+
+    offset = agg._cached_log_offset
+    # 追加一条写了一半的行：不应被消费
+    line = json.dumps({"pmid": "502", "action": "add", "created_at": now + 1})
+    with p.open("a", encoding="utf-8") as f:
+        f.write(line[:10])
+    assert len(agg._load_raw_logs()) == len(first)
+    with p.open("a", encoding="utf-8") as f:
+        f.write(line[10:] + "\n")
+    log_review_action({"pmid": "501", "action": "accept", "creator": "x@bristol.ac.uk", "created_at": now + 2}, path=p)
+
+    logs = agg._load_raw_logs()
+    assert agg._cached_log_offset > offset
+    assert [l["pmid"] for l in logs[len(first):]] == ["502", "501"]
+    assert [l["action"] for l in agg._logs_for_pmid("501")] == ["add", "accept"]
+
+    # 截断/重写 -> 全量重载
+    p.write_text(json.dumps({"pmid": "9", "action": "add"}) + "\n", encoding="utf-8")
+    assert [l["pmid"] for l in agg._load_raw_logs()] == ["9"]
+
+
+def test_conflict_overview_recounts_only_after_new_logs(monkeypatch, tmp_path):
+    p = tmp_path / "logs.jsonl"
+    monkeypatch.setenv("MANUAL_REVIEW_REVIEW_LOGS_PATH", str(p))
+    monkeypatch.setattr(agg, "iter_pmids", lambda: ())
+    agg.invalidate_cache()
+    now = time.time()
+    log_review_action({"pmid": "601", "action": "add", "subject": "A", "subject_type": "dsyn", "predicate": "TREATS",
+                       "object": "B", "object_type": "phsu", "created_at": now}, path=p)
+    log_review_action({"pmid": "601", "action": "accept", "created_at": now + 1}, path=p)
+    assert agg.get_conflict_overview()["per_pmid"]["601"] == 0
+    assert "601" in agg._conflict_count_cache
+
+    # 新日志使该 pmid 的计数缓存失效并重新统计
+    log_review_action({"pmid": "601", "action": "reject", "created_at": now + 2}, path=p)
+    over = agg.get_conflict_overview()
+    assert over["per_pmid"]["601"] == over["conflicts"] == 1
+
+
+def test_aggregation_results_are_copies_and_caches_bounded(monkeypatch, tmp_path):
+    p = tmp_path / "logs.jsonl"
+    monkeypatch.setenv("MANUAL_REVIEW_REVIEW_LOGS_PATH", str(p))
+    monkeypatch.setattr(agg, "_groups_cache", agg._LRU(2))
+    agg.invalidate_cache()
+    now = time.time()
+    for i, pmid in enumerate(("701", "702", "703")):
+        log_review_action({"pmid": pmid, "action": "add", "subject": "A", "predicate": "TREATS", "object": "B",
+                           "created_at": now + i}, path=p)
+    # 调用方改返回值不影响缓存
+    groups = agg.aggregate_assertions_for_pmid("701")
+    next(iter(groups.values())).clear()
+    assert all(agg.aggregate_assertions_for_pmid("701").values())
+    summary = agg.get_detailed_assertion_summary("701")
+    summary[0]["logs"].clear()
+    summary[0]["reviewers"].append("x")
+    again = agg.get_detailed_assertion_summary("701")
+    assert again[0]["logs"] and "x" not in again[0]["reviewers"]
+    # 超出上限时淘汰最久未用的 pmid
+    for pmid in ("702", "703"):
+        agg.aggregate_assertions_for_pmid(pmid)
+    assert list(agg._groups_cache) == ["702", "703"]
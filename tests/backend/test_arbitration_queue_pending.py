@@ -17,4 +17,46 @@ def test_arbitration_queue_include_pending(client):
     r = client.get("/api/arbitration/queue?only_conflicts=false&include_pending=true")
     assert r.status_code == 200
     items = r.get_json()["data"]["items"]
-    assert any(it["pmid"] == pmid and it["assertion_id"] == aid for it in items)
\ No newline at end of file
+    assert any(it["pmid"] == pmid and it["assertion_id"] == aid for it in items)
+
+def test_arbitration_queue_rows_cached_until_logs_change(monkeypatch, tmp_path):
+    from backend.services import aggregation as agg
+    from backend.services import arbitration as arb
+    p = tmp_path / "logs.jsonl"
+    monkeypatch.setenv("MANUAL_REVIEW_REVIEW_LOGS_PATH", str(p))
+    agg.invalidate_cache()
+    pmid = "QC-1"
+    now = time.time()
+    log_review_action({"pmid": pmid, "action": "add", "subject": "S", "subject_type": "dsyn",
+                       "predicate": "TREATS", "object": "O", "object_type": "phsu", "created_at": now}, path=p)
+    log_review_action({"pmid": pmid, "action": "accept", "reviewer": "a@bristol.ac.uk", "created_at": now + 1}, path=p)
+    assert arb.get_arbitration_queue(pmid=pmid) == []
+    rows = arb._queue_rows_for_pmid(pmid)
+    assert arb._queue_rows_for_pmid(pmid) is rows  # 日志未变：复用
+
+    # 新日志 -> 行重建，冲突进入队列
+    log_review_action({"pmid": pmid, "action": "reject", "reviewer": "b@bristol.ac.uk", "created_at": now + 2}, path=p)
+    items = arb.get_arbitration_queue(pmid=pmid)
+    assert [it["status"] for it in items] == ["conflict"]
+    assert items[0]["conflict_reason"] == "contains reject"
+
+
+def test_arbitration_history_tracks_new_records(monkeypatch, tmp_path):
+    from backend.services import aggregation as agg
+    from backend.services import arbitration as arb
+    p = tmp_path / "logs.jsonl"
+    monkeypatch.setenv("MANUAL_REVIEW_REVIEW_LOGS_PATH", str(p))
+    agg.invalidate_cache()
+    pmid, aid = "AH-1", "aid-1"
+    now = time.time()
+    log_review_action({"pmid": pmid, "action": "add", "assertion_id": aid, "created_at": now}, path=p)
+    log_review_action({"pmid": pmid, "action": "accept", "assertion_id": aid, "reviewer": "a@bristol.ac.uk", "created_at": now + 1}, path=p)
+    log_review_action({"pmid": pmid, "action": "reject", "assertion_id": aid, "reviewer": "b@bristol.ac.uk", "created_at": now + 2}, path=p)
+    assert arb.get_arbitration_history(aid, pmid) == []
+
+    first = arb.set_arbitration_result(pmid, aid, "accept", "admin@bristol.ac.uk")
+    assert [l["action"] for l in arb.get_arbitration_history(aid, pmid)] == ["arbitrate"]
+    arb.undo_arbitration(aid, pmid, "admin@bristol.ac.uk")
+    hist = arb.get_arbitration_history(aid, pmid)
+    assert [l["action"] for l in hist] == ["arbitrate", "arbitrate_undo"]
+    assert arb.get_latest_arbitration(aid, pmid)["created_at"] == first["created_at"]
@@ -8,7 +8,7 @@ def _reset_state():
 def test_prefer_current_and_refresh(monkeypatch):
     _reset_state()
     # 仅两个摘要
-    monkeypatch.setattr(assign, "load_abstracts", lambda: [{"pmid": "P1"}, {"pmid": "P2"}])
+    monkeypatch.setattr(assign, "load_abstracts", lambda **_: [{"pmid": "P1"}, {"pmid": "P2"}])
     e = "a@b.com"; n = "A"
 
     # 首次分配
@@ -22,7 +22,7 @@ def test_prefer_current_and_refresh(monkeypatch):
 
 def test_concurrency_limit_and_fallback(monkeypatch):
     _reset_state()
-    monkeypatch.setattr(assign, "load_abstracts", lambda: [{"pmid": "P1"}, {"pmid": "P2"}])
+    monkeypatch.setattr(assign, "load_abstracts", lambda **_: [{"pmid": "P1"}, {"pmid": "P2"}])
     # 限制每个摘要仅 1 人
     monkeypatch.setattr(assign, "_MAX_CONCURRENT_REVIEWERS", 1)
 
@@ -33,7 +33,7 @@ def test_concurrency_limit_and_fallback(monkeypatch):
 
 def test_expiration_release(monkeypatch):
     _reset_state()
-    monkeypatch.setattr(assign, "load_abstracts", lambda: [{"pmid": "P1"}])
+    monkeypatch.setattr(assign, "load_abstracts", lambda **_: [{"pmid": "P1"}])
 
     p = assign.assign_abstract_to_reviewer("x@b.com", "X")
     assert p == "P1" and assign.who_has_abstract("P1")
@@ -27,4 +27,16 @@ def test_assert_integrity_ok(monkeypatch, tmp_path):
     monkeypatch.setenv("MANUAL_REVIEW_REVIEWERS_JSON", str(reviewers))
     monkeypatch.setenv("MANUAL_REVIEW_FINAL_EXPORT_PATH", str(exports))
 
-    assert cfg.assert_integrity(raise_on_missing=False) is True
\ No newline at end of file
+    assert cfg.assert_integrity(raise_on_missing=False) is True
+
+
+def test_assert_integrity_cached_until_invalidated(monkeypatch, tmp_path):
+    abstracts = tmp_path / "late.jsonl"
+    monkeypatch.setenv("MANUAL_REVIEW_ABSTRACTS_PATH", str(abstracts))
+    cfg.invalidate_runtime_paths()
+    assert cfg.assert_integrity(raise_on_missing=False) is False
+    # 文件随后出现：TTL 内仍返回缓存结果，显式失效后重新检查
+    abstracts.write_text("{}\n", encoding="utf-8")
+    assert cfg.assert_integrity(raise_on_missing=False) is False
+    cfg.invalidate_runtime_paths()
+    assert cfg.assert_integrity(raise_on_missing=False) is True
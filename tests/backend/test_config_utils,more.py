@@ -14,6 +14,14 @@ def test_config_helpers_and_validators(monkeypatch, tmp_path):
     monkeypatch.setenv("MANUAL_REVIEW_FINAL_EXPORT_PATH", str(tmp_path / "exports" / "final.jsonl"))
     assert cfg.assert_integrity(raise_on_missing=False) is False
 
+def test_validators_case_insensitive_and_type_safe():
+    # 大小写两种都能命中；非字符串（含不可哈希）直接 False 而不是抛错
+    assert cfg.validate_predicate("TREATS") and cfg.validate_predicate("treats")
+    assert cfg.validate_entity_type("dsyn") and cfg.validate_entity_type("DSYN")
+    assert not cfg.validate_predicate("NOT_A_PREDICATE")
+    assert not cfg.validate_predicate(["TREATS"])
+    assert not cfg.validate_entity_type(None)
+
 def test_utils_helpers():
     assert is_valid_email("alice@bristol.ac.uk")
     assert not is_valid_email("bad@evil.com")  # 默认限制域
@@ -16,4 +16,198 @@ def test_load_logs_tail_and_filters(logs_path):
     only_accept = get_reviewer_logs("alice@bristol.ac.uk", actions={"accept"})
     assert len(only_accept) == 1
     window = get_reviewer_logs("alice@bristol.ac.uk", since_ts=ts0+1, until_ts=ts0+20)
-    assert len(window) == 1  # 只剩 reject 那条
\ No newline at end of file
+    assert len(window) == 1  # 只剩 reject 那条
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = list(docs)
+        self.sorted_by = None
+
+    def sort(self, key, direction=1):
+        self.sorted_by = key if isinstance(key, list) else [(key, direction)]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    def __iter__(self):
+        return iter(self.docs)
+
+
+class _LogsCol:
+    """Narrow stand-in for logs_col：find/aggregate 返回预置结果并记录查询，insert 记录写入。"""
+
+    def __init__(self, found=(), aggregated=(), gate=None):
+        self.found, self.aggregated, self.gate = list(found), list(aggregated), gate
+        self.queries, self.inserted, self.insert_calls = [], [], 0
+
+    def _insert(self, docs):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.insert_calls += 1
+        self.inserted += [dict(d) for d in docs]
+
+    def insert_one(self, doc):
+        self._insert([doc])
+
+    def insert_many(self, docs, ordered=True):
+        self._insert(docs)
+
+    def find(self, q=None, proj=None):
+        self.queries.append(q)
+        self.cursor = _Cursor(self.found)
+        return self.cursor
+
+    def aggregate(self, pipeline):
+        self.queries.append(pipeline)
+        return iter(self.aggregated)
+
+
+def _use_logs_col(monkeypatch, col):
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", col)
+    return col
+
+
+def test_reviewer_logs_mongo_filters_actor_action_window(monkeypatch):
+    import backend.models.logs as logs_model
+    col = _use_logs_col(monkeypatch, _LogsCol(found=[
+        {"pmid": "1", "action": "accept", "creator": "bob@bristol.ac.uk", "actor_lc": "bob@bristol.ac.uk", "created_at": 5.0},
+        # creator 是别人、reviewer 才是本人：首个非空 actor 不是 bob，应被剔除
+        {"pmid": "2", "action": "accept", "creator": "x@y", "reviewer": "bob@bristol.ac.uk", "actor_lc": "x@y", "created_at": 6.0},
+        {"pmid": "3", "action": "reject", "creator": "bob@bristol.ac.uk", "actor_lc": "bob@bristol.ac.uk", "created_at": 7.0},
+        {"pmid": "4", "action": "accept", "creator": "bob@bristol.ac.uk", "actor_lc": "bob@bristol.ac.uk", "created_at": 50.0},
+    ]))
+    out = logs_model.get_reviewer_logs("Bob@bristol.ac.uk", actions={"Accept"}, since_ts=1, until_ts=10)
+    assert [o["pmid"] for o in out] == ["1"]
+    q, = col.queries
+    assert q["created_at"] == {"$gte": 1.0, "$lte": 10.0}
+    assert {"actor_lc": "bob@bristol.ac.uk", "action": {"$in": ["accept"]}} in q["$or"]
+
+
+def test_reviewer_logs_mongo_keeps_legacy_records_without_actor_lc(monkeypatch):
+    import re
+    import backend.models.logs as logs_model
+    legacy = {"pmid": "1", "action": " Accept ", "reviewer": " Bob@Bristol.ac.uk ", "created_at": 1.0}
+    col = _use_logs_col(monkeypatch, _LogsCol(found=[legacy]))
+    out = logs_model.get_reviewer_logs("bob@bristol.ac.uk", actions={"accept"}, since_ts=0, until_ts=10)
+    assert [o["pmid"] for o in out] == ["1"]
+    # 旧记录分支：无 actor_lc，按原始字段大小写/空白不敏感匹配，action 交给 Python 复核
+    q, = col.queries
+    old, = [b for b in q["$or"] if "actor_lc" in b and b["actor_lc"] == {"$exists": False}]
+    pat = old["$or"][1]["reviewer"]
+    assert "action" not in old and re.match(pat["$regex"], legacy["reviewer"], re.I)
+
+
+def test_stats_for_reviewer_counts_in_mongo(monkeypatch):
+    import backend.models.logs as logs_model
+    _use_logs_col(monkeypatch, _LogsCol(aggregated=[{"abstracts": [{"n": 2}], "adds": [{"n": 2}]}]))
+    st = logs_model.get_stats_for_reviewer("Bob@bristol.ac.uk", per_abstract_rate=1.0, per_assertion_add_rate=0.5)
+    assert (st["reviewed_abstracts"], st["assertions_added"], st["commission"]) == (2, 2, 3.0)
+    _use_logs_col(monkeypatch, _LogsCol(aggregated=[{"abstracts": [], "adds": []}]))
+    st = logs_model.get_stats_for_reviewer("bob@bristol.ac.uk", since_ts=2.5, until_ts=10)
+    assert (st["reviewed_abstracts"], st["assertions_added"]) == (0, 0)
+
+
+def test_reviewer_logs_actor_lc_and_legacy_records(tmp_path, monkeypatch):
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    p = tmp_path / "actor.jsonl"
+    log_review_action({"pmid": "1", "action": " Accept ", "creator": " Carol@Bristol.ac.uk ", "created_at": 1.0}, path=p)
+    # 旧记录没有 actor_lc，字段也未规范化：走现场规范化路径
+    with p.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"pmid": "2", "action": "REJECT", "reviewer": "carol@bristol.ac.uk", "created_at": 2.0}) + "\n")
+    new = load_logs(path=p)[0]
+    assert new["actor_lc"] == "carol@bristol.ac.uk" and new["action"] == "accept"
+    got = get_reviewer_logs("Carol@bristol.ac.uk", path=p, actions={"accept", "reject"})
+    assert [g["pmid"] for g in got] == ["1", "2"]
+
+
+
+def test_padded_actor_and_action_are_normalized_for_mongo(tmp_path, monkeypatch):
+    import backend.models.logs as logs_model
+    col = _use_logs_col(monkeypatch, _LogsCol())
+    p = tmp_path / "both.jsonl"
+    log_review_action({"pmid": "1", "action": " Accept ", "creator": " Carol@Bristol.ac.uk ", "created_at": 1.0}, path=p)
+    log_review_action({"pmid": "2", "action": "ADD", "reviewer": "carol@bristol.ac.uk ", "created_at": 2.0}, path=p)
+    assert logs_model.flush_pending_logs(timeout=5) is True
+    # Mongo 与文件拿到同一份规范化记录，精确匹配 actor_lc/action 即可
+    assert [(d["actor_lc"], d["action"]) for d in col.inserted] == [("carol@bristol.ac.uk", "accept"), ("carol@bristol.ac.uk", "add")]
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    assert [(d["actor_lc"], d["action"]) for d in load_logs(path=p)] == [(d["actor_lc"], d["action"]) for d in col.inserted]
+
+
+def test_mongo_log_inserts_are_batched_and_flushed_before_reads(tmp_path, monkeypatch):
+    col = _use_logs_col(monkeypatch, _LogsCol())
+    p = tmp_path / "batched.jsonl"
+    for i in range(20):
+        log_review_action({"pmid": str(i), "action": "add", "creator": "u@bristol.ac.uk"}, path=p)
+    # 读路径先 flush：本进程写入的记录一定已交给 Mongo；只有后台线程出队，按入队顺序按批插入
+    load_logs()
+    assert [d["pmid"] for d in col.inserted] == [str(i) for i in range(20)]
+    assert col.insert_calls < 20
+
+
+def test_load_logs_limit_returns_latest_in_mongo(monkeypatch):
+    # Mongo 按时间倒序返回最新 N 条，结果翻回升序
+    col = _use_logs_col(monkeypatch, _LogsCol(found=[{"pmid": str(i), "created_at": float(i)} for i in (9, 8, 7, 6)]))
+    assert [o["pmid"] for o in load_logs(limit=2)] == ["8", "9"]
+    assert col.cursor.sorted_by == [("created_at", -1), ("timestamp", -1)]
+
+
+def test_reviewer_logs_latest_per_action_in_mongo(monkeypatch):
+    import backend.models.logs as logs_model
+    col = _use_logs_col(monkeypatch, _LogsCol(aggregated=[
+        {"pmid": str(i), "action": act, "creator": "bob@bristol.ac.uk", "actor_lc": "bob@bristol.ac.uk", "created_at": float(i)}
+        for i, act in ((1, "reject"), (2, "accept"))
+    ]))
+    out = logs_model.get_reviewer_logs("bob@bristol.ac.uk", actions={"accept", "reject"})
+    assert [(o["pmid"], o["action"]) for o in out] == [("1", "reject"), ("2", "accept")]
+    # 去重在服务端完成：只拉回每个 action 最新的一条
+    pipeline, = col.queries
+    assert any("$group" in stage for stage in pipeline)
+
+
+def test_flush_pending_logs_is_bounded_when_mongo_stalls(tmp_path, monkeypatch):
+    import threading
+    import backend.models.logs as logs_model
+    release = threading.Event()
+    col = _use_logs_col(monkeypatch, _LogsCol(gate=release))
+    log_review_action({"pmid": "1", "action": "add"}, path=tmp_path / "stall.jsonl")
+    # Mongo 卡住时读路径最多等 timeout，不会无限挂起
+    assert logs_model.flush_pending_logs(timeout=0.1) is False
+    release.set()
+    assert logs_model.flush_pending_logs(timeout=5) is True
+    assert [d["pmid"] for d in col.inserted] == ["1"]
+
+
+def test_aggregation_waits_for_mongo_outside_its_lock(tmp_path, monkeypatch):
+    import threading
+    from backend.services import aggregation
+    release = threading.Event()
+    _use_logs_col(monkeypatch, _LogsCol(gate=release))
+    log_review_action({"pmid": "1", "action": "add"}, path=tmp_path / "stall.jsonl")
+    aggregation.invalidate_cache()  # 强制下次读取重新加载快照
+    reader = threading.Thread(target=aggregation.get_logged_pmids)
+    reader.start()
+    try:
+        # 读者在锁外等在途写入：其它线程仍能拿到聚合锁
+        time.sleep(0.05)
+        assert aggregation._log_file_lock.acquire(timeout=1)
+        aggregation._log_file_lock.release()
+    finally:
+        release.set()
+        reader.join(5)
+    assert not reader.is_alive()
+
+
+def test_backfill_script_file_only_without_mongo(tmp_path, monkeypatch):
+    from backend.scripts import backfill_log_actor_lc as backfill
+    monkeypatch.delenv("MONGO_URI", raising=False)
+    p = tmp_path / "legacy.jsonl"
+    p.write_text(json.dumps({"pmid": "1", "action": " REJECT ", "reviewer": " Carol@Bristol.ac.uk "}) + "\n", encoding="utf-8")
+    backfill.main(["--no-mongo", "--file", str(p)])  # 不导入 db，也就不需要 MONGO_URI
+    rec = json.loads(p.read_text(encoding="utf-8"))
+    assert (rec["actor_lc"], rec["action"]) == ("carol@bristol.ac.uk", "reject")
@@ -0,0 +1,170 @@
+# tests/backend/test_logs_jsonl_parse.py
+from backend.models.logs import _parse_jsonl_file, load_logs
+
+def test_parse_jsonl_skips_blank_and_bad_lines(tmp_path):
+    p = tmp_path / "logs.jsonl"
+    p.write_bytes('{"pmid":"1","action":"add"}\n\n   \nnot-json\n[1,2]\n{"pmid":"2","subject":"é"}'.encode("utf-8"))
+    out = _parse_jsonl_file(p)
+    assert [o["pmid"] for o in out] == ["1", "2"]
+    assert out[1]["subject"] == "é"
+
+    # 空文件不能 mmap，应直接返回空列表
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert _parse_jsonl_file(empty) == []
+    assert load_logs(path=empty) == []
+
+
+def test_log_review_actions_batch_append(tmp_path, monkeypatch):
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    p = tmp_path / "batch.jsonl"
+    n = logs_model.log_review_actions(
+        [{"pmid": "1", "action": " Accept "}, {"pmid": "1", "action": "reject", "bad": {1, 2}}, {"pmid": "2", "action": "add"}],
+        path=p,
+    )
+    # 不可序列化的记录被跳过，其余一次写入
+    assert n == 2
+    out = _parse_jsonl_file(p)
+    assert [(o["pmid"], o["action"]) for o in out] == [("1", "accept"), ("2", "add")]
+    assert all("created_at" in o for o in out)
+    assert logs_model.log_review_actions([], path=p) == 0
+
+
+def test_write_all_uses_writev_and_finishes_short_writes(tmp_path, monkeypatch):
+    import os
+    import backend.models.logs as logs_model
+    calls = []
+
+    def _short_writev(fd, bufs):
+        calls.append(len(bufs))
+        return os.write(fd, bufs[0][:3])  # 模拟短写：只写进去 3 字节
+
+    monkeypatch.setattr(logs_model, "_writev", _short_writev)
+    p = tmp_path / "v.jsonl"
+    fd = os.open(str(p), os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    try:
+        logs_model._write_all(fd, [b'{"a":1}\n', b'{"b":2}\n'])
+        logs_model._write_all(fd, [b'{"c":3}\n'])  # 单行直接 os.write
+    finally:
+        os.close(fd)
+    assert calls == [2]
+    assert p.read_bytes() == b'{"a":1}\n{"b":2}\n{"c":3}\n'
+
+
+def test_encode_line_matches_stdlib_semantics():
+    import json
+    from backend.models.logs import _encode_line
+    rec = {"action": "arbitrate", "comment": "中文 é", "review_states": {0: "ok"}, "created_at": 1.5}
+    raw = _encode_line(rec)
+    # 单行、UTF-8 原样输出、非字符串键与 json.dumps 一样转成字符串
+    assert raw.endswith(b"\n") and raw.count(b"\n") == 1
+    assert "中文 é".encode("utf-8") in raw
+    assert json.loads(raw) == json.loads(json.dumps(rec, ensure_ascii=False))
+
+
+def test_load_logs_tail_spans_blocks(tmp_path, monkeypatch):
+    import json
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    monkeypatch.setattr(logs_model, "_TAIL_BLOCK_SIZE", 64)  # 强制跨越多个块
+    p = tmp_path / "tail.jsonl"
+    p.write_text("".join(json.dumps({"pmid": str(i), "action": "add"}) + "\n" for i in range(50)), encoding="utf-8")
+    tail = load_logs(limit=7, path=p)
+    assert [o["pmid"] for o in tail] == [str(i) for i in range(43, 50)]
+    assert [o["pmid"] for o in load_logs(limit=500, path=p)] == [str(i) for i in range(50)]
+    # 单块内含远多于 limit 的行：头部截在完整行边界，不会混入半行
+    monkeypatch.setattr(logs_model, "_TAIL_BLOCK_SIZE", 1 << 16)
+    assert [o["pmid"] for o in load_logs(limit=3, path=p)] == ["47", "48", "49"]
+
+
+def test_load_logs_tail_crlf_and_trailing_newline(tmp_path, monkeypatch):
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    p = tmp_path / "crlf.jsonl"
+    p.write_bytes(b'{"pmid":"1"}\r\n{"pmid":"2"}\r\n{"pmid":"3"}\r\n')
+    # 末尾换行不占名额；\r 作为 JSON 空白被忽略
+    assert [o["pmid"] for o in load_logs(limit=2, path=p)] == ["2", "3"]
+
+
+def test_concurrent_appends_share_fsync(tmp_path, monkeypatch):
+    import os
+    import threading
+    import time
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    monkeypatch.setattr(logs_model, "_FSYNC_MODE", "sync")
+    syncs = []
+
+    def _slow_fsync(fd):
+        syncs.append(fd)
+        time.sleep(0.05)
+
+    monkeypatch.setattr(logs_model, "_fdatasync", _slow_fsync)
+    p = tmp_path / "group.jsonl"
+    threads = [threading.Thread(target=logs_model.log_review_action, args=({"pmid": str(i), "action": "add"},), kwargs={"path": p}) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 每条都已落盘可读；并发写入合并成少量 fsync（组提交）
+    assert sorted(int(o["pmid"]) for o in _parse_jsonl_file(p)) == list(range(8))
+    assert 1 <= len(syncs) < 8
+
+
+def test_log_fsync_env_values():
+    import backend.models.logs as logs_model
+    # "1"/"true" 保持逐条落盘；延迟落盘需显式 "deferred"
+    assert [logs_model._fsync_mode(v) for v in ("1", " TRUE ", "yes", "sync")] == ["sync"] * 4
+    assert logs_model._fsync_mode("Deferred") == "deferred"
+    assert [logs_model._fsync_mode(v) for v in ("0", "false", "off", "")] == ["off"] * 4
+
+
+def test_deferred_fsync_every_n_and_on_idle(tmp_path, monkeypatch):
+    import time
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    monkeypatch.setattr(logs_model, "_FSYNC_MODE", "deferred")
+    monkeypatch.setattr(logs_model, "_FSYNC_EVERY", 4)
+    monkeypatch.setattr(logs_model, "_FSYNC_INTERVAL", 0.1)
+    logs_model.sync_pending_logs()  # 先清掉其它用例留下的待落盘计数，避免其定时器计入
+    syncs = []
+    monkeypatch.setattr(logs_model, "_fdatasync", syncs.append)
+    p = tmp_path / "deferred.jsonl"
+    for i in range(6):
+        logs_model.log_review_action({"pmid": str(i), "action": "add"}, path=p)
+    # 每 4 条落盘一次；剩下 2 条由空闲定时器补上
+    assert len(syncs) == 1 and len(_parse_jsonl_file(p)) == 6
+    time.sleep(0.3)
+    assert len(syncs) == 2 and logs_model._deferred_sync[str(p)][0] == 0
+
+
+def test_scan_jsonl_blocks_and_partial_tail(tmp_path, monkeypatch):
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "_SCAN_BLOCK_SIZE", 16)  # 强制多块，且单行长于块
+    p = tmp_path / "scan.jsonl"
+    body = b"".join(b'{"pmid":"%d","action":"add"}\n' % i for i in range(20))
+    p.write_bytes(body + b'\n \nbad\n{"pmid":"20"}')
+    recs, off = logs_model._scan_jsonl(p)
+    # 残行可解析时一并收下并读到文件末尾
+    assert [r["pmid"] for r in recs] == [str(i) for i in range(21)]
+    assert off == p.stat().st_size
+
+    p.write_bytes(body + b'{"pmid":"2')  # 写入中途的残行不消费
+    recs, off = logs_model._scan_jsonl(p)
+    assert len(recs) == 20 and off == len(body)
+    more, off2 = logs_model._scan_jsonl(p, 5)  # 从行中间开始：首个残片被跳过
+    assert [r["pmid"] for r in more] == [str(i) for i in range(1, 20)] and off2 == len(body)
+
+
+def test_load_logs_missing_or_unreadable_file(tmp_path, monkeypatch):
+    import backend.models.logs as logs_model
+    monkeypatch.setattr(logs_model, "logs_col", None)
+    # 不存在、是目录（IO 错误）都返回空列表；空文件不打开
+    assert load_logs(path=tmp_path / "missing.jsonl") == []
+    assert load_logs(path=tmp_path) == []
+    assert load_logs(path=tmp_path, limit=3) == []
+    # 父路径是普通文件：stat 抛 NotADirectoryError，同样返回空列表
+    parent = tmp_path / "not_a_dir"
+    parent.write_text("", encoding="utf-8")
+    assert load_logs(path=parent / "logs.jsonl") == []
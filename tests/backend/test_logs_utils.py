@@ -5,4 +5,10 @@ def test_to_float_ts_variants():
     assert _to_float_ts(123.4) == 123.4
     assert _to_float_ts("123.4") == 123.4
     assert _to_float_ts("bad") == 0.0
-    assert _to_float_ts(None) == 0.0
\ No newline at end of file
+    assert _to_float_ts(None) == 0.0
+
+def test_norm_lc_interns_and_matches_strip_lower():
+    from backend.models.logs import _norm_lc
+    a = _norm_lc(" Accept ")
+    assert a == "accept" and _norm_lc(" Accept ") is a and _norm_lc("accept") is a
+    assert _norm_lc(5) == "5"
@@ -10,4 +10,38 @@ def test_abstracts_misc_and_assertion_helpers():
     assert isinstance(aid, str) and aid
     rec = {"subject":"A","predicate":"TREATS","object":"B"}
     rej = reject_assertion(original=rec, reviewer="x@b.a", pmid="1001", sentence_idx=0, sentence_text="t", reason="no")
-    assert rej["action"] == "reject"
\ No newline at end of file
+    assert rej["action"] == "reject"
+
+
+def test_content_hash_stable_and_switchable(monkeypatch):
+    import hashlib
+    from backend.domain import assertions as D
+    # 默认 sha1：必须与历史的 sha1("|".join(lower(trim(...)))) 一致
+    h = D.compute_content_hash(pmid=" 42 ", sentence_idx=3, subject=" Aspirin ", subject_type="PHSU",
+                               predicate="TREATS", object_="Pain", object_type="sosy")
+    assert h == hashlib.sha1(b"42|3|aspirin|phsu|treats|pain|sosy").hexdigest()
+
+    monkeypatch.setattr(D, "CONTENT_HASH_ALGO", "blake2b")
+    h2 = D.compute_content_hash(pmid="42", sentence_idx=3, subject="aspirin", subject_type="phsu",
+                                predicate="treats", object_="pain", object_type="sosy")
+    assert h2 == hashlib.blake2b(b"42|3|aspirin|phsu|treats|pain|sosy", digest_size=20).hexdigest()
+    assert len(h2) == len(h)
+
+
+def test_content_hash_memoized():
+    from backend.domain import assertions as D
+    kw = dict(pmid=7, sentence_idx=0, subject="x", subject_type="dsyn",
+              predicate="TREATS", object_="y", object_type="sosy")
+    first = D.compute_content_hash(**kw)
+    hits = D._hash_norm.cache_info().hits
+    # 仅大小写/空白不同：归一化后命中同一缓存项
+    assert D.compute_content_hash(**{**kw, "subject": " X "}) == first
+    assert D._hash_norm.cache_info().hits == hits + 1
+
+
+def test_fast_uuid4_unique_and_valid():
+    import uuid
+    from backend.domain import assertions as D
+    ids = [D._fast_uuid4_str() for _ in range(600)]  # 跨越一次池子补充
+    assert len(set(ids)) == len(ids)
+    assert all(uuid.UUID(i).version == 4 for i in ids)
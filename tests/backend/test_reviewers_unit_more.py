@@ -9,6 +9,22 @@ def test_reviewers_load_save_direct(tmp_path, monkeypatch):
     lst = R.load_reviewers()
     assert lst and lst[0]["email"] == "a@bristol.ac.uk"
 
+def _file_store(tmp_path, monkeypatch):
+    # 只测文件存储：隔离 Mongo，路径指向临时目录
+    monkeypatch.setattr(R, "reviewers_col", None)
+    p = tmp_path / "reviewers.json"
+    monkeypatch.setenv("MANUAL_REVIEW_REVIEWERS_JSON", str(p))
+    return p
+
+def test_reviewers_file_stays_utf8_indented_json(tmp_path, monkeypatch):
+    import json
+    p = _file_store(tmp_path, monkeypatch)
+    R.save_reviewers([{"email": "z@bristol.ac.uk", "name": "Zoë 张", "active": True, "role": "reviewer"}])
+    # 写出格式与 json.dump(ensure_ascii=False, indent=2) 一致
+    text = p.read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), ensure_ascii=False, indent=2)
+    assert R.get_reviewer_by_email("Z@bristol.ac.uk")["name"] == "Zoë 张"
+
 def _admin_login(client):
     with client.session_transaction() as s:
         s["email"] = "admin@bristol.ac.uk"
@@ -30,4 +46,62 @@ def test_reviewers_routes_edge_cases(client):
     assert r.status_code == 200
     # 删除不存在
     r = client.delete("/api/reviewers/none@bristol.ac.uk")
-    assert r.status_code == 200
\ No newline at end of file
+    assert r.status_code == 200
+
+def test_reviewers_cache_follows_file_changes(tmp_path, monkeypatch):
+    import json
+    p = _file_store(tmp_path, monkeypatch)
+    p.write_text(json.dumps([{"email": "a@bristol.ac.uk", "name": "A"}]), encoding="utf-8")
+    assert [r["email"] for r in R.load_reviewers()] == ["a@bristol.ac.uk"]
+    assert R.load_reviewers() == R.load_reviewers()
+    # 外部改写（大小变化）会被察觉；自身写入后立即可见
+    p.write_text(json.dumps([{"email": "b@bristol.ac.uk", "name": "Bob"}]), encoding="utf-8")
+    assert [r["email"] for r in R.load_reviewers()] == ["b@bristol.ac.uk"]
+    assert R.get_reviewer_by_email("a@bristol.ac.uk") is None
+    R.add_reviewer("c@bristol.ac.uk", "C")
+    assert [r["email"] for r in R.load_reviewers()] == ["b@bristol.ac.uk", "c@bristol.ac.uk"]
+
+
+def test_reviewers_email_index_ops(tmp_path, monkeypatch):
+    _file_store(tmp_path, monkeypatch)
+    R.add_reviewer("x@bristol.ac.uk", "X")
+    R.add_reviewer("y@bristol.ac.uk", "Y")
+    assert R.get_reviewer_by_email(" X@bristol.ac.uk ")["name"] == "X"
+    assert R.get_reviewer_by_email("y@bristol.ac.uk")["name"] == "Y"
+    try:
+        R.add_reviewer(" X@Bristol.ac.uk ", "dup")
+        assert False, "duplicate should be rejected"
+    except ValueError:
+        pass
+    R.update_reviewer("Y@bristol.ac.uk", {"name": " Yan ", "role": "ADMIN"})
+    assert R.get_reviewer_by_email("y@bristol.ac.uk")["name"] == "Yan"
+    R.delete_reviewer("x@bristol.ac.uk")
+    assert R.get_reviewer_by_email("x@bristol.ac.uk") is None
+    assert [r["email"] for r in R.load_reviewers()] == ["y@bristol.ac.uk"]
+
+
+def test_reviewers_normalized_views_are_independent_lists(tmp_path, monkeypatch):
+    import json
+    p = _file_store(tmp_path, monkeypatch)
+    p.write_text(json.dumps([
+        {"email": " B@bristol.ac.uk ", "name": "B2"},
+        {"email": "a@bristol.ac.uk", "name": "A", "role": "boss"},
+        {"email": "b@bristol.ac.uk", "name": "B"},
+    ]), encoding="utf-8")
+    first = R.get_all_reviewers()
+    assert [(r["email"], r["name"], r["role"]) for r in first] == [
+        ("a@bristol.ac.uk", "A", "reviewer"), ("b@bristol.ac.uk", "B", "reviewer"),
+    ]
+    # 返回新列表：调用方排序/过滤不影响下一次结果
+    first.reverse()
+    assert [r["email"] for r in R.get_all_reviewers()] == ["a@bristol.ac.uk", "b@bristol.ac.uk"]
+    assert len(R.load_reviewers()) == 3
+
+
+def test_reviewers_write_replaces_file_atomically(tmp_path, monkeypatch):
+    p = _file_store(tmp_path, monkeypatch)
+    R.add_reviewer("s@bristol.ac.uk", "S")
+    R.add_reviewer("t@bristol.ac.uk", "T")
+    # 临时文件写完后 rename 到位，不留残骸
+    assert sorted(x.name for x in tmp_path.iterdir()) == [p.name]
+    assert [r["email"] for r in R.load_reviewers()] == ["s@bristol.ac.uk", "t@bristol.ac.uk"]
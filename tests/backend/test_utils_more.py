@@ -7,4 +7,13 @@ def test_utils_bulk():
     assert safe_int("12", default=-1) == 12 and safe_int("x", default=-1) == -1
     assert safe_float("1.5", default=-1.0) == 1.5 and safe_float("x", default=-1.0) == -1.0
     assert coerce_bool("true") is True and coerce_bool("0") is False
-    assert _domain_matches("x@bristol.ac.uk", {"bristol.ac.uk"})
\ No newline at end of file
+    assert _domain_matches("x@bristol.ac.uk", {"bristol.ac.uk"})
+
+def test_is_valid_email_length_cap_and_repeat_calls():
+    from backend.utils import is_valid_email
+    # 超过 RFC 5321 长度直接拒绝，不走正则
+    assert not is_valid_email("a" * 250 + "@bristol.ac.uk")
+    # 重复调用（缓存命中）结果一致，且大小写/空白归一
+    assert is_valid_email(" Bob@Bristol.ac.uk ") and is_valid_email("bob@bristol.ac.uk")
+    assert not is_valid_email("bob@evil.com") and not is_valid_email("bob@evil.com")
+    assert is_valid_email("bob@evil.com", restrict_domain=False)